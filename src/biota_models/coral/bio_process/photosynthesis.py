@@ -109,10 +109,11 @@ class Photosynthesis:
             """Thermal-acclimation."""
             if self.constants.tme:
                 if self.first_year:
+                    temp_mmm = env.temp_mmm
                     env.tmeMMMmin = (
                         pd.DataFrame(
                             data=pd.concat(
-                                [env.temp_mmm["min"]] * _reshape.space, axis=1
+                                [temp_mmm["min"]] * _reshape.space, axis=1
                             ).values,
                             columns=[np.arange(_reshape.space)],
                         )
@@ -121,7 +122,7 @@ class Photosynthesis:
                     env.tmeMMMmax = (
                         pd.DataFrame(
                             data=pd.concat(
-                                [env.temp_mmm["max"]] * _reshape.space, axis=1
+                                [temp_mmm["max"]] * _reshape.space, axis=1
                             ).values,
                             columns=[np.arange(_reshape.space)],
                         )
@@ -149,10 +150,12 @@ class Photosynthesis:
                 m_max = mmm_max.mean(axis=0)
                 s_max = mmm_max.std(axis=0)
             else:
-                mmm = env.temp_mmm[
+                # the monthly means are derived on every access, get them once.
+                temp_mmm = env.temp_mmm
+                mmm = temp_mmm[
                     np.logical_and(
-                        env.temp_mmm.index < year,
-                        env.temp_mmm.index >= year - int(self.constants.nn / coral.Csp),
+                        temp_mmm.index < year,
+                        temp_mmm.index >= year - int(self.constants.nn / coral.Csp),
                     )
                 ]
                 m_min, m_max = mmm.mean(axis=0)
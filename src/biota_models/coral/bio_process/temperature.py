@@ -23,12 +23,13 @@ class Temperature:
         :type coral: Coral
         """
         if self.constants.tme:
-            delta_t = RESHAPE().variable2matrix(coral.delta_t, "space")
-            coral.dTc = (
-                (delta_t * self.constants.ap)
-                / (self.constants.k * self.constants.K0)
-                * coral.light
-            )
+            _reshape = RESHAPE()
+            delta_t = _reshape.variable2array(coral.delta_t)
+            _reshape.dimension_value(delta_t, "space")
+            # fold the scalar constants so the matrices are only walked twice;
+            # a (space, 1) view of delta_t broadcasts over time without tiling.
+            coef = self.constants.ap / (self.constants.k * self.constants.K0)
+            coral.dTc = (coef * delta_t.reshape(-1, 1)) * coral.light
             coral.temp = self.T + coral.dTc
         else:
             coral.temp = self.T
@@ -7,7 +7,6 @@ from netCDF4 import Dataset
 from pandas import DataFrame
 
 from src.biota_models.coral.model.coral_model import Coral
-from src.core.common.space_time import DataReshape
 from src.core.output.base_output_model import BaseOutput, BaseOutputParameters
 
 
@@ -52,6 +51,8 @@ class CoralMapOutput(_CoralOutput):
         """
         if not self.valid_output():
             return
+        # the file is recreated, close a dataset kept open for its updates.
+        self.close()
         # Open netcdf data and initialize needed variables.
         with Dataset(self.output_filepath, "w", format="NETCDF4") as _map_data:
             _map_data.description = "Mapped simulation data of the CoralModel."
@@ -77,11 +78,14 @@ class CoralMapOutput(_CoralOutput):
             x[:] = self.xy_coordinates[:, 0]
             y[:] = self.xy_coordinates[:, 1]
 
+            # time-varying variables in chunks of whole (annual) writes, compressed.
+            variable_settings = self.get_variable_settings(self.space)
+
             # initial conditions
             # Definition of methods to initialize the netcdf variables.
             def init_lme():
                 light_set = _map_data.createVariable(
-                    "Iz", "f8", ("time", "nmesh2d_face")
+                    "Iz", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 light_set.long_name = "annual mean representative light-intensity"
                 light_set.units = "micro-mol photons m-2 s-1"
@@ -89,7 +93,7 @@ class CoralMapOutput(_CoralOutput):
 
             def init_fme():
                 flow_set = _map_data.createVariable(
-                    "ucm", "f8", ("time", "nmesh2d_face")
+                    "ucm", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 flow_set.long_name = "annual mean in-canopy flow"
                 flow_set.units = "m s-1"
@@ -97,95 +101,119 @@ class CoralMapOutput(_CoralOutput):
 
             def init_tme():
                 temp_set = _map_data.createVariable(
-                    "Tc", "f8", ("time", "nmesh2d_face")
+                    "Tc", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 temp_set.long_name = "annual mean coral temperature"
                 temp_set.units = "K"
                 temp_set[:, :] = 0
 
                 low_temp_set = _map_data.createVariable(
-                    "Tlo", "f8", ("time", "nmesh2d_face")
+                    "Tlo", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 low_temp_set.long_name = "annual mean lower thermal limit"
                 low_temp_set.units = "K"
                 low_temp_set[:, :] = 0
 
                 high_temp_set = _map_data.createVariable(
-                    "Thi", "f8", ("time", "nmesh2d_face")
+                    "Thi", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 high_temp_set.long_name = "annual mean upper thermal limit"
                 high_temp_set.units = "K"
                 high_temp_set[:, :] = 0
 
             def init_pd():
-                pd_set = _map_data.createVariable("PD", "f8", ("time", "nmesh2d_face"))
+                pd_set = _map_data.createVariable(
+                    "PD", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 pd_set.long_name = "annual sum photosynthetic rate"
                 pd_set.units = "-"
                 pd_set[:, :] = 0
 
             def init_ps():
-                pt_set = _map_data.createVariable("PT", "f8", ("time", "nmesh2d_face"))
+                pt_set = _map_data.createVariable(
+                    "PT", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 pt_set.long_name = (
                     "total living coral population at the end of the year"
                 )
                 pt_set.units = "-"
                 pt_set[:, :] = coral.living_cover
 
-                ph_set = _map_data.createVariable("PH", "f8", ("time", "nmesh2d_face"))
+                ph_set = _map_data.createVariable(
+                    "PH", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 ph_set.long_name = "healthy coral population at the end of the year"
                 ph_set.units = "-"
                 ph_set[:, :] = coral.living_cover
 
-                pr_set = _map_data.createVariable("PR", "f8", ("time", "nmesh2d_face"))
+                pr_set = _map_data.createVariable(
+                    "PR", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 pr_set.long_name = "recovering coral population at the end of the year"
                 pr_set.units = "-"
                 pr_set[:, :] = 0
 
-                pp_set = _map_data.createVariable("PP", "f8", ("time", "nmesh2d_face"))
+                pp_set = _map_data.createVariable(
+                    "PP", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 pp_set.long_name = "pale coral population at the end of the year"
                 pp_set.units = "-"
                 pp_set[:, :] = 0
 
-                pb_set = _map_data.createVariable("PB", "f8", ("time", "nmesh2d_face"))
+                pb_set = _map_data.createVariable(
+                    "PB", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 pb_set.long_name = "bleached coral population at the end of the year"
                 pb_set.units = "-"
                 pb_set[:, :] = 0
 
             def init_calc():
                 calc_set = _map_data.createVariable(
-                    "calc", "f8", ("time", "nmesh2d_face")
+                    "calc", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 calc_set.long_name = "annual sum calcification rate"
                 calc_set.units = "kg m-2 yr-1"
                 calc_set[:, :] = 0
 
             def init_md():
-                dc_set = _map_data.createVariable("dc", "f8", ("time", "nmesh2d_face"))
+                dc_set = _map_data.createVariable(
+                    "dc", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 dc_set.long_name = "coral plate diameter"
                 dc_set.units = "m"
                 dc_set[0, :] = coral.dc
 
-                hc_set = _map_data.createVariable("hc", "f8", ("time", "nmesh2d_face"))
+                hc_set = _map_data.createVariable(
+                    "hc", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 hc_set.long_name = "coral height"
                 hc_set.units = "m"
                 hc_set[0, :] = coral.hc
 
-                bc_set = _map_data.createVariable("bc", "f8", ("time", "nmesh2d_face"))
+                bc_set = _map_data.createVariable(
+                    "bc", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 bc_set.long_name = "coral base diameter"
                 bc_set.units = "m"
                 bc_set[0, :] = coral.bc
 
-                tc_set = _map_data.createVariable("tc", "f8", ("time", "nmesh2d_face"))
+                tc_set = _map_data.createVariable(
+                    "tc", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 tc_set.long_name = "coral plate thickness"
                 tc_set.units = "m"
                 tc_set[0, :] = coral.tc
 
-                ac_set = _map_data.createVariable("ac", "f8", ("time", "nmesh2d_face"))
+                ac_set = _map_data.createVariable(
+                    "ac", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 ac_set.long_name = "coral axial distance"
                 ac_set.units = "m"
                 ac_set[0, :] = coral.ac
 
-                vc_set = _map_data.createVariable("Vc", "f8", ("time", "nmesh2d_face"))
+                vc_set = _map_data.createVariable(
+                    "Vc", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 vc_set.long_name = "coral volume"
                 vc_set.units = "m3"
                 vc_set[0, :] = coral.volume
@@ -200,7 +228,7 @@ class CoralMapOutput(_CoralOutput):
                 md=init_md,
             )
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
 
     def update(self, coral: Coral, year: int):
@@ -214,49 +242,48 @@ class CoralMapOutput(_CoralOutput):
         """
         if not self.valid_output():
             return
-        with Dataset(self.output_filepath, mode="a") as _map_data:
+        with self.append_dataset() as _map_data:
+            # the variables by name, without the dataset (path) lookup.
+            _map_vars = _map_data.variables
             i = int(year - self.first_year)
-            _map_data["time"][i] = year
+            _map_vars["time"][i] = year
 
             def update_lme():
-                _map_data["Iz"][-1, :] = coral.light[:, -1]
+                _map_vars["Iz"][-1, :] = coral.light[:, -1]
 
             def update_fme():
-                _map_data["ucm"][-1, :] = coral.ucm
+                _map_vars["ucm"][-1, :] = coral.ucm
 
             def update_tme():
-                _map_data["Tc"][-1, :] = coral.temp[:, -1]
-                _map_data["Tlo"][-1, :] = (
-                    coral.Tlo
-                    if len(DataReshape.variable2array(coral.Tlo)) > 1
-                    else coral.Tlo * np.ones(self.space)
-                )
-                _map_data["Thi"][-1, :] = (
-                    coral.Thi
-                    if len(DataReshape.variable2array(coral.Thi)) > 1
-                    else coral.Thi * np.ones(self.space)
-                )
+                _map_vars["Tc"][-1, :] = coral.temp[:, -1]
+                # a uniform (scalar) limit is broadcast over the domain.
+                _map_vars["Tlo"][-1, :] = np.asarray(coral.Tlo)
+                _map_vars["Thi"][-1, :] = np.asarray(coral.Thi)
 
             def update_pd():
-                _map_data["PD"][-1, :] = coral.photo_rate.mean(axis=1)
+                _map_vars["PD"][-1, :] = coral.photo_rate.mean(axis=1)
 
             def update_ps():
-                _map_data["PT"][-1, :] = coral.pop_states[:, -1, :].sum(axis=1)
-                _map_data["PH"][-1, :] = coral.pop_states[:, -1, 0]
-                _map_data["PR"][-1, :] = coral.pop_states[:, -1, 1]
-                _map_data["PP"][-1, :] = coral.pop_states[:, -1, 2]
-                _map_data["PB"][-1, :] = coral.pop_states[:, -1, 3]
+                # the end-of-year states once, as contiguous (state, space) rows
+                pop_states = np.ascontiguousarray(
+                    coral.pop_states[:, -1, :].transpose()
+                )
+                _map_vars["PT"][-1, :] = pop_states.sum(axis=0)
+                _map_vars["PH"][-1, :] = pop_states[0]
+                _map_vars["PR"][-1, :] = pop_states[1]
+                _map_vars["PP"][-1, :] = pop_states[2]
+                _map_vars["PB"][-1, :] = pop_states[3]
 
             def update_calc():
-                _map_data["calc"][-1, :] = coral.calc.sum(axis=1)
+                _map_vars["calc"][-1, :] = coral.calc.sum(axis=1)
 
             def update_md():
-                _map_data["dc"][-1, :] = coral.dc
-                _map_data["hc"][-1, :] = coral.hc
-                _map_data["bc"][-1, :] = coral.bc
-                _map_data["tc"][-1, :] = coral.tc
-                _map_data["ac"][-1, :] = coral.ac
-                _map_data["Vc"][-1, :] = coral.volume
+                _map_vars["dc"][-1, :] = coral.dc
+                _map_vars["hc"][-1, :] = coral.hc
+                _map_vars["bc"][-1, :] = coral.bc
+                _map_vars["tc"][-1, :] = coral.tc
+                _map_vars["ac"][-1, :] = coral.ac
+                _map_vars["Vc"][-1, :] = coral.volume
 
             conditions_funct = dict(
                 lme=update_lme,
@@ -268,7 +295,7 @@ class CoralMapOutput(_CoralOutput):
                 md=update_md,
             )
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
 
 
@@ -286,6 +313,8 @@ class CoralHisOutput(_CoralOutput):
         """Initiate history output file in which daily output at predefined locations within the model is stored."""
         if not self.valid_output():
             return
+        # the file is recreated, close a dataset kept open for its updates.
+        self.close()
         with Dataset(self.output_filepath, "w", format="NETCDF4") as _his_data:
             _his_data.description = "Historic simulation data of the CoralModel"
 
@@ -305,86 +334,121 @@ class CoralHisOutput(_CoralOutput):
             x[:] = self.xy_stations[:, 0]
             y[:] = self.xy_stations[:, 1]
 
+            # time-varying variables in chunks of whole (annual) writes, compressed.
+            variable_settings = self.get_variable_settings(len(self.xy_stations), 365)
+
             def init_lme():
-                light_set = _his_data.createVariable("Iz", "f8", ("time", "stations"))
+                light_set = _his_data.createVariable(
+                    "Iz", "f8", ("time", "stations"), **variable_settings
+                )
                 light_set.long_name = "representative light-intensity"
                 light_set.units = "micro-mol photons m-2 s-1"
 
             def init_fme():
-                flow_set = _his_data.createVariable("ucm", "f8", ("time", "stations"))
+                flow_set = _his_data.createVariable(
+                    "ucm", "f8", ("time", "stations"), **variable_settings
+                )
                 flow_set.long_name = "in-canopy flow"
                 flow_set.units = "m s-1"
 
             def init_tme():
-                temp_set = _his_data.createVariable("Tc", "f8", ("time", "stations"))
+                temp_set = _his_data.createVariable(
+                    "Tc", "f8", ("time", "stations"), **variable_settings
+                )
                 temp_set.long_name = "coral temperature"
                 temp_set.units = "K"
 
                 low_temp_set = _his_data.createVariable(
-                    "Tlo", "f8", ("time", "stations")
+                    "Tlo", "f8", ("time", "stations"), **variable_settings
                 )
                 low_temp_set.long_name = "lower thermal limit"
                 low_temp_set.units = "K"
 
                 high_temp_set = _his_data.createVariable(
-                    "Thi", "f8", ("time", "stations")
+                    "Thi", "f8", ("time", "stations"), **variable_settings
                 )
                 high_temp_set.long_name = "upper thermal limit"
                 high_temp_set.units = "K"
 
             def init_pd():
-                pd_set = _his_data.createVariable("PD", "f8", ("time", "stations"))
+                pd_set = _his_data.createVariable(
+                    "PD", "f8", ("time", "stations"), **variable_settings
+                )
                 pd_set.long_name = "photosynthetic rate"
                 pd_set.units = "-"
 
             def init_ps():
-                pt_set = _his_data.createVariable("PT", "f8", ("time", "stations"))
+                pt_set = _his_data.createVariable(
+                    "PT", "f8", ("time", "stations"), **variable_settings
+                )
                 pt_set.long_name = "total coral population"
                 pt_set.units = "-"
 
-                ph_set = _his_data.createVariable("PH", "f8", ("time", "stations"))
+                ph_set = _his_data.createVariable(
+                    "PH", "f8", ("time", "stations"), **variable_settings
+                )
                 ph_set.long_name = "healthy coral population"
                 ph_set.units = "-"
 
-                pr_set = _his_data.createVariable("PR", "f8", ("time", "stations"))
+                pr_set = _his_data.createVariable(
+                    "PR", "f8", ("time", "stations"), **variable_settings
+                )
                 pr_set.long_name = "recovering coral population"
                 pr_set.units = "-"
 
-                pp_set = _his_data.createVariable("PP", "f8", ("time", "stations"))
+                pp_set = _his_data.createVariable(
+                    "PP", "f8", ("time", "stations"), **variable_settings
+                )
                 pp_set.long_name = "pale coral population"
                 pp_set.units = "-"
 
-                pb_set = _his_data.createVariable("PB", "f8", ("time", "stations"))
+                pb_set = _his_data.createVariable(
+                    "PB", "f8", ("time", "stations"), **variable_settings
+                )
                 pb_set.long_name = "bleached coral population"
                 pb_set.units = "-"
 
             def init_calc():
-                calc_set = _his_data.createVariable("G", "f8", ("time", "stations"))
+                calc_set = _his_data.createVariable(
+                    "G", "f8", ("time", "stations"), **variable_settings
+                )
                 calc_set.long_name = "calcification"
                 calc_set.units = "kg m-2 d-1"
 
             def init_md():
-                dc_set = _his_data.createVariable("dc", "f8", ("time", "stations"))
+                dc_set = _his_data.createVariable(
+                    "dc", "f8", ("time", "stations"), **variable_settings
+                )
                 dc_set.long_name = "coral plate diameter"
                 dc_set.units = "m"
 
-                hc_set = _his_data.createVariable("hc", "f8", ("time", "stations"))
+                hc_set = _his_data.createVariable(
+                    "hc", "f8", ("time", "stations"), **variable_settings
+                )
                 hc_set.long_name = "coral height"
                 hc_set.units = "m"
 
-                bc_set = _his_data.createVariable("bc", "f8", ("time", "stations"))
+                bc_set = _his_data.createVariable(
+                    "bc", "f8", ("time", "stations"), **variable_settings
+                )
                 bc_set.long_name = "coral base diameter"
                 bc_set.units = "m"
 
-                tc_set = _his_data.createVariable("tc", "f8", ("time", "stations"))
+                tc_set = _his_data.createVariable(
+                    "tc", "f8", ("time", "stations"), **variable_settings
+                )
                 tc_set.long_name = "coral plate thickness"
                 tc_set.units = "m"
 
-                ac_set = _his_data.createVariable("ac", "f8", ("time", "stations"))
+                ac_set = _his_data.createVariable(
+                    "ac", "f8", ("time", "stations"), **variable_settings
+                )
                 ac_set.long_name = "coral axial distance"
                 ac_set.units = "m"
 
-                vc_set = _his_data.createVariable("Vc", "f8", ("time", "stations"))
+                vc_set = _his_data.createVariable(
+                    "Vc", "f8", ("time", "stations"), **variable_settings
+                )
                 vc_set.long_name = "coral volume"
                 vc_set.units = "m3"
 
@@ -399,7 +463,7 @@ class CoralHisOutput(_CoralOutput):
                 md=init_md,
             )
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
 
     def update(self, coral: Coral, dates: DataFrame):
@@ -413,81 +477,54 @@ class CoralHisOutput(_CoralOutput):
         """
         if not self.valid_output():
             return
-        with Dataset(self.output_filepath, mode="a") as _his_data:
+        with self.append_dataset() as _his_data:
+            # the variables by name, without the dataset (path) lookup.
+            _his_vars = _his_data.variables
             y_dates = dates.reset_index(drop=True)
-            ti = (y_dates - self.first_date).dt.days.values
-            _his_data["time"][ti] = y_dates.values
+            ti = self.get_time_index((y_dates - self.first_date).dt.days.values)
+            _his_vars["time"][ti] = y_dates.values
 
             def update_lme():
-                _his_data["Iz"][ti, :] = coral.light[self.idx_stations, :].transpose()
+                _his_vars["Iz"][ti, :] = coral.light[self.idx_stations, :].transpose()
 
             def update_fme():
-                _his_data["ucm"][ti, :] = np.tile(coral.ucm, (len(y_dates), 1))[
-                    :, self.idx_stations
-                ]
+                _his_vars["ucm"][ti, :] = np.atleast_2d(coral.ucm)[:, self.idx_stations]
 
             def update_tme():
-                _his_data["Tc"][ti, :] = coral.temp[self.idx_stations, :].transpose()
-                if (
-                    len(DataReshape.variable2array(coral.Tlo)) > 1
-                    and len(DataReshape.variable2array(coral.Thi)) > 1
-                ):
-                    _his_data["Tlo"][ti, :] = np.tile(coral.Tlo, (len(y_dates), 1))[
-                        :, self.idx_stations
-                    ]
-                    _his_data["Thi"][ti, :] = np.tile(coral.Thi, (len(y_dates), 1))[
-                        :, self.idx_stations
-                    ]
-                else:
-                    _his_data["Tlo"][ti, :] = coral.Tlo * np.ones(
-                        (len(y_dates), len(self.idx_stations))
-                    )
-                    _his_data["Thi"][ti, :] = coral.Thi * np.ones(
-                        (len(y_dates), len(self.idx_stations))
-                    )
+                _his_vars["Tc"][ti, :] = coral.temp[self.idx_stations, :].transpose()
+                tlo, thi = np.asarray(coral.Tlo), np.asarray(coral.Thi)
+                if tlo.size > 1 and thi.size > 1:
+                    tlo, thi = tlo[self.idx_stations], thi[self.idx_stations]
+                # the limits are constant over the year, broadcast over its days.
+                _his_vars["Tlo"][ti, :] = tlo
+                _his_vars["Thi"][ti, :] = thi
 
             def update_pd():
-                _his_data["PD"][ti, :] = coral.photo_rate[
+                _his_vars["PD"][ti, :] = coral.photo_rate[
                     self.idx_stations, :
                 ].transpose()
 
             def update_ps():
-                _his_data["PT"][ti, :] = (
-                    coral.pop_states[self.idx_stations, :, :].sum(axis=2).transpose()
+                # the stations' states once, as contiguous (state, time, station) slabs
+                pop_states = np.ascontiguousarray(
+                    coral.pop_states[self.idx_stations].transpose(2, 1, 0)
                 )
-                _his_data["PH"][ti, :] = coral.pop_states[
-                    self.idx_stations, :, 0
-                ].transpose()
-                _his_data["PR"][ti, :] = coral.pop_states[
-                    self.idx_stations, :, 1
-                ].transpose()
-                _his_data["PP"][ti, :] = coral.pop_states[
-                    self.idx_stations, :, 2
-                ].transpose()
-                _his_data["PB"][ti, :] = coral.pop_states[
-                    self.idx_stations, :, 3
-                ].transpose()
+                _his_vars["PT"][ti, :] = pop_states.sum(axis=0)
+                _his_vars["PH"][ti, :] = pop_states[0]
+                _his_vars["PR"][ti, :] = pop_states[1]
+                _his_vars["PP"][ti, :] = pop_states[2]
+                _his_vars["PB"][ti, :] = pop_states[3]
 
             def update_calc():
-                _his_data["G"][ti, :] = coral.calc[self.idx_stations, :].transpose()
+                _his_vars["G"][ti, :] = coral.calc[self.idx_stations, :].transpose()
 
             def update_md():
-                _his_data["dc"][ti, :] = np.tile(coral.dc, (len(y_dates), 1))[
-                    :, self.idx_stations
-                ]
-                _his_data["hc"][ti, :] = np.tile(coral.hc, (len(y_dates), 1))[
-                    :, self.idx_stations
-                ]
-                _his_data["bc"][ti, :] = np.tile(coral.bc, (len(y_dates), 1))[
-                    :, self.idx_stations
-                ]
-                _his_data["tc"][ti, :] = np.tile(coral.tc, (len(y_dates), 1))[
-                    :, self.idx_stations
-                ]
-                _his_data["ac"][ti, :] = np.tile(coral.ac, (len(y_dates), 1))[
-                    :, self.idx_stations
-                ]
-                _his_data["Vc"][ti, :] = np.tile(coral.volume, (len(y_dates), 1))[
+                _his_vars["dc"][ti, :] = np.atleast_2d(coral.dc)[:, self.idx_stations]
+                _his_vars["hc"][ti, :] = np.atleast_2d(coral.hc)[:, self.idx_stations]
+                _his_vars["bc"][ti, :] = np.atleast_2d(coral.bc)[:, self.idx_stations]
+                _his_vars["tc"][ti, :] = np.atleast_2d(coral.tc)[:, self.idx_stations]
+                _his_vars["ac"][ti, :] = np.atleast_2d(coral.ac)[:, self.idx_stations]
+                _his_vars["Vc"][ti, :] = np.atleast_2d(coral.volume)[
                     :, self.idx_stations
                 ]
 
@@ -501,5 +538,5 @@ class CoralHisOutput(_CoralOutput):
                 md=update_md,
             )
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
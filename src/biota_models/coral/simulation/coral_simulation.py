@@ -124,11 +124,6 @@ class _CoralSimulation(BaseSimulation, ABC):
         self.validate_environment()
         RESHAPE().space = self.hydrodynamics.space
 
-        if self.output.defined:
-            self.output.initialize(self.biota)
-        else:
-            print("WARNING: No output defined, so none exported.")
-
         xy = self.hydrodynamics.xy_coordinates
 
         if value is None:
@@ -136,19 +131,28 @@ class _CoralSimulation(BaseSimulation, ABC):
 
         cover = value * np.ones(RESHAPE().space)
 
+        # coral cover only strictly within the given ranges, set in one pass.
+        in_range = np.ones(RESHAPE().space, dtype=bool)
         if x_range is not None:
-            x_min = x_range[0] if x_range[0] is not None else min(xy[:][0])
-            x_max = x_range[1] if x_range[1] is not None else max(xy[:][0])
-            cover[np.logical_or(xy[:][0] <= x_min, xy[:][0] >= x_max)] = 0
+            x_coordinates = xy[:, 0]
+            x_min = x_range[0] if x_range[0] is not None else x_coordinates.min()
+            x_max = x_range[1] if x_range[1] is not None else x_coordinates.max()
+            in_range &= (x_min < x_coordinates) & (x_coordinates < x_max)
 
         if y_range is not None:
-            y_min = y_range[0] if y_range[0] is not None else min(xy[:][1])
-            y_max = y_range[1] if y_range[1] is not None else max(xy[:][1])
-            cover[np.logical_or(xy[:][1] <= y_min, xy[:][1] >= y_max)] = 0
+            y_coordinates = xy[:, 1]
+            y_min = y_range[0] if y_range[0] is not None else y_coordinates.min()
+            y_max = y_range[1] if y_range[1] is not None else y_coordinates.max()
+            in_range &= (y_min < y_coordinates) & (y_coordinates < y_max)
+        cover *= in_range
 
         self.biota.initiate_coral_morphology(cover)
 
+        # initialize the output once (with the initiated coral), it recreates the
+        # output files.
         self.output.initialize(self.biota)
+        if not self.output.defined:
+            print("WARNING: No output defined, so none exported.")
 
     def run(self, duration: Optional[int] = None):
         """Run simulation.
@@ -170,12 +174,16 @@ class _CoralSimulation(BaseSimulation, ABC):
             int(environment_dates.iloc[0].year + duration),
         )
 
-        with tqdm(range((int(duration)))) as progress:
+        # the year of each date, to select the dates of every simulated year.
+        environment_years = environment_dates.dt.year.to_numpy()
+        # the temperature (in Kelvin) is derived on every access, get it once.
+        temp_kelvin = self.environment.temp_kelvin
+        # the output files are closed when leaving the run, also when it fails.
+        with self.output, tqdm(range((int(duration)))) as progress:
             for i in progress:
+                year_dates = environment_dates[environment_years == years[i]]
                 # set dimensions (i.e. update time-dimension)
-                RESHAPE().time = len(
-                    environment_dates.dt.year[environment_dates.dt.year == years[i]]
-                )
+                RESHAPE().time = len(year_dates)
 
                 # if-statement that encompasses all for which the hydrodynamic should be used
                 progress.set_postfix(inner_loop=f"update {self.hydrodynamics}")
@@ -212,9 +220,7 @@ class _CoralSimulation(BaseSimulation, ABC):
                 # thermal micro-environment
                 tme = Temperature(
                     constants=self.constants,
-                    temperature=time_series_year(
-                        self.environment.temp_kelvin, years[i]
-                    ),
+                    temperature=time_series_year(temp_kelvin, years[i]),
                 )
                 tme.coral_temperature(self.biota)
 
@@ -280,10 +286,8 @@ class _CoralSimulation(BaseSimulation, ABC):
                 # map-file
                 self.output.map_output.update(self.biota, years[i])
                 # his-file
-                self.output.his_output.update(
-                    self.biota,
-                    environment_dates[environment_dates.dt.year == years[i]],
-                )
+                self.output.his_output.update(self.biota, year_dates)
+                self.output.sync()
 
     def finalise(self):
         """Finalise simulation."""
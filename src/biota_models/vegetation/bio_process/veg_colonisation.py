@@ -6,6 +6,8 @@ from src.biota_models.vegetation.model.veg_constants import VegetationConstants
 from src.biota_models.vegetation.model.veg_model import Vegetation
 from src.core.base_model import ExtraModel
 
+_rng = np.random.default_rng()
+
 
 class Colonization(ExtraModel):
     """
@@ -21,7 +23,9 @@ class Colonization(ExtraModel):
     seed_loc1: Optional[np.ndarray]
     seed_loc2: Optional[np.ndarray]
 
-    def update(self, veg_species1: Vegetation, veg_species2: Optional[Vegetation]):
+    def update(
+        self, veg_species1: Vegetation, veg_species2: Optional[Vegetation] = None
+    ):
         """Update marsh cover after colonization (settlement)
         if two vegetation objects are given (different species),
         they will compete for space when they colonize
@@ -33,84 +37,47 @@ class Colonization(ExtraModel):
         if not veg_species2:
             # # available locations for settlement
             Colonization.col_location(self, veg_species1)
-            loc = veg_species1.initial.veg_frac[self.seed_loc]
-            loc[
-                veg_species1.total_cover[self.seed_loc]
-                <= (1 - veg_species1.constants.iniCol_frac)
-            ] = 1
+            if self.seed_loc.size == 0:
+                # no seedlings settle, so there is nothing to update
+                return
+            loc = Colonization._settlement_fraction(
+                veg_species1, self.seed_loc, veg_species1.total_cover
+            )
             veg_species1.initial.veg_frac[self.seed_loc] = (
                 loc * veg_species1.constants.iniCol_frac
             )
-            veg_species1.initial.veg_height[self.seed_loc] = (
-                loc * veg_species1.constants.iniShoot
-            )
-            veg_species1.initial.stem_dia[self.seed_loc] = (
-                loc * veg_species1.constants.iniDia
-            )
-            veg_species1.initial.root_len[self.seed_loc] = (
-                loc * veg_species1.constants.iniRoot
-            )
-            veg_species1.initial.stem_num[self.seed_loc] = (
-                loc * veg_species1.constants.num_stem[0]
-            )
+            Colonization._settle(veg_species1, self.seed_loc, loc)
 
         # TODO test this!
         else:
-            total_cover = veg_species1.total_cover + veg_species2.total_cover
-
             Colonization.col_location(self, veg_species1)
             self.seed_loc1 = self.seed_loc
             Colonization.col_location(self, veg_species2)
             self.seed_loc2 = self.seed_loc
+            if self.seed_loc1.size == 0 and self.seed_loc2.size == 0:
+                # no seedlings settle, so there is nothing to update
+                return
 
-            loc1 = veg_species1.initial.veg_frac[self.seed_loc1]
-            loc1[
-                total_cover[self.seed_loc1] <= (1 - veg_species1.constants.iniCol_frac)
-            ] = 1
-            loc2 = veg_species2.initial.veg_frac[self.seed_loc2]
-            loc2[
-                total_cover[self.seed_loc2] <= (1 - veg_species2.constants.iniCol_frac)
-            ] = 1
-
-            veg_species1.initial.veg_height[self.seed_loc1] = (
-                loc1 * veg_species1.constants.iniShoot
-            )
-            veg_species1.initial.stem_dia[self.seed_loc1] = (
-                loc1 * veg_species1.constants.iniDia
-            )
-            veg_species1.initial.root_len[self.seed_loc1] = (
-                loc1 * veg_species1.constants.iniRoot
-            )
-            veg_species1.initial.stem_num[self.seed_loc1] = (
-                loc1 * veg_species1.constants.num_stem[0]
-            )
-
-            veg_species2.initial.veg_height[self.seed_loc2] = (
-                loc2 * veg_species2.constants.iniShoot
-            )
-            veg_species2.initial.stem_dia[self.seed_loc2] = (
-                loc2 * veg_species2.constants.iniDia
-            )
-            veg_species2.initial.root_len[self.seed_loc2] = (
-                loc2 * veg_species2.constants.iniRoot
+            total_cover = veg_species1.total_cover + veg_species2.total_cover
+            loc1 = Colonization._settlement_fraction(
+                veg_species1, self.seed_loc1, total_cover
             )
-            veg_species2.initial.stem_num[self.seed_loc2] = (
-                loc2 * veg_species2.constants.num_stem[0]
+            loc2 = Colonization._settlement_fraction(
+                veg_species2, self.seed_loc2, total_cover
             )
+            Colonization._settle(veg_species1, self.seed_loc1, loc1)
+            Colonization._settle(veg_species2, self.seed_loc2, loc2)
 
             # comp = np.where(loc1 == 1 and loc2 == 1)
-            if (
+            ini_col_frac = (
                 veg_species1.constants.iniCol_frac + veg_species2.constants.iniCol_frac
-                > 1
-            ):
-                loc1[np.in1d(self.seed_loc1, self.seed_loc2) == True] = 1 / (
-                    veg_species1.constants.iniCol_frac
-                    + veg_species2.constants.iniCol_frac
-                )
-                loc2[np.in1d(self.seed_loc2, self.seed_loc1) == True] = 1 / (
-                    veg_species1.constants.iniCol_frac
-                    + veg_species2.constants.iniCol_frac
-                )
+            )
+            if ini_col_frac > 1:
+                # random settlement draws with replacement, so the seed locations
+                # are not guaranteed to be unique (no `assume_unique` here).
+                shared = 1 / ini_col_frac
+                loc1[np.isin(self.seed_loc1, self.seed_loc2)] = shared
+                loc2[np.isin(self.seed_loc2, self.seed_loc1)] = shared
 
             veg_species1.initial.veg_frac[self.seed_loc1] = (
                 loc1 * veg_species1.constants.iniCol_frac
@@ -119,6 +86,31 @@ class Colonization(ExtraModel):
                 loc2 * veg_species2.constants.iniCol_frac
             )
 
+    @staticmethod
+    def _settlement_fraction(
+        veg: Vegetation, seed_loc: np.ndarray, total_cover: np.ndarray
+    ) -> np.ndarray:
+        """
+        Fraction that settles in each seed location; a full settlement where there is
+        still room for the initial colonisation fraction, the current initial
+        fraction elsewhere.
+        """
+        return np.where(
+            total_cover[seed_loc] <= (1 - veg.constants.iniCol_frac),
+            1.0,
+            veg.initial.veg_frac[seed_loc],
+        )
+
+    @staticmethod
+    def _settle(veg: Vegetation, seed_loc: np.ndarray, loc: np.ndarray):
+        """Set the initial characteristics of the seedlings in the seed locations."""
+        initial = veg.initial
+        constants = veg.constants
+        initial.veg_height[seed_loc] = loc * constants.iniShoot
+        initial.stem_dia[seed_loc] = loc * constants.iniDia
+        initial.root_len[seed_loc] = loc * constants.iniRoot
+        initial.stem_num[seed_loc] = loc * constants.num_stem[0]
+
     def col_location(self, veg: Vegetation):
         """
         new vegetation settlement
@@ -134,9 +126,11 @@ class Colonization(ExtraModel):
         if veg.constants.random == 0:
             self.seed_loc = self.seed_loc[0]
         else:
-            self.seed_loc = np.random.choice(
-                self.seed_loc[0], round(len(self.seed_loc[0]) / veg.constants.random)
-            )  # locations where random settlement can occur
+            # random selection (with replacement) of the possible locations
+            n_seeds = round(len(self.seed_loc[0]) / veg.constants.random)
+            self.seed_loc = self.seed_loc[0][
+                _rng.integers(0, len(self.seed_loc[0]), size=n_seeds)
+            ]  # locations where random settlement can occur
 
     def colonization_criterion(self, veg: Vegetation):
         """determine areas which are available for colonization
@@ -160,16 +154,17 @@ class Colonization(ExtraModel):
         """
 
         # # Calculations
-        self.cir = np.zeros(veg.max_wl.shape)
-        self.cir = (
-            Colonization.cir_formula(veg.max_wl, veg.min_wl) == 1
+        self.cir = Colonization.cir_formula(
+            veg.max_wl, veg.min_wl
         )  # true, false matrix look for cells that are flooded during high anf low water levels
 
     @staticmethod
     def cir_formula(max_water_level, min_water_level):
-        max_water_level[max_water_level > 0] = 1
-        min_water_level[min_water_level > 0] = 1
-        return max_water_level - min_water_level
+        """
+        Cells flooded at the maximum water level but dry at the minimum one.
+        The given water levels are not modified.
+        """
+        return (max_water_level > 0) & ~(min_water_level > 0)
 
 
 ##TODO get information on mud in top layer from DFM
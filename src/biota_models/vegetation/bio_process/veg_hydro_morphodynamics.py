@@ -1,42 +1,66 @@
+from typing import Optional
+
 import numpy as np
 
 from src.biota_models.vegetation.model.veg_model import Vegetation
+from src.core import RESHAPE
 
 
 class Hydro_Morphodynamics:
     """Get the values for the hydromorphodynamic environment"""
 
-    def __init__(self, tau_cur, u_cur, wl_cur, bl_cur, ts, veg: Vegetation):
+    def __init__(
+        self,
+        tau_cur=None,
+        u_cur=None,
+        wl_cur=None,
+        bl_cur=None,
+        ts=0,
+        veg: Optional[Vegetation] = None,
+    ):
+        # the time step values are only stored when given, so a simulation can
+        # create this object once and `update` it every time step.
+        if veg is not None:
+            self.update(tau_cur, u_cur, wl_cur, bl_cur, ts, veg)
 
+    def update(self, tau_cur, u_cur, wl_cur, bl_cur, ts, veg: Vegetation):
+        """Store the hydromorphodynamic values of time step `ts` of the ets."""
         self.tau = tau_cur
         self.u = u_cur
         self.wl = wl_cur
         self.bl = bl_cur
         self.ts = ts
-        if ts == 0:
-            veg.tau_ts = self.tau
-            veg.u_ts = self.u
-            veg.wl_ts = self.wl
-            veg.bl_ts = self.bl
+        ts_values = veg.hydromorph_ts
+        if ts == 0 or ts_values is None:
+            # one column per time step of the ets (RESHAPE().time), filled in
+            # place instead of re-stacking the whole history every time step
+            ts_values = np.zeros((4, len(self.tau), max(RESHAPE().time, 1)))
+            n_filled = 0
         else:
-            veg.tau_ts = np.column_stack((veg.tau_ts, self.tau))
-            veg.u_ts = np.column_stack((veg.u_ts, self.u))
-            veg.wl_ts = np.column_stack((veg.wl_ts, self.wl))
-            veg.bl_ts = np.column_stack((veg.bl_ts, self.bl))
+            n_filled = veg.tau_ts.shape[1]
+            if ts >= ts_values.shape[2]:
+                # more time steps than expected, double the number of columns.
+                n_columns = max(2 * ts_values.shape[2], ts + 1)
+                grown_values = np.zeros(ts_values.shape[:2] + (n_columns,))
+                grown_values[:, :, :n_filled] = ts_values[:, :, :n_filled]
+                ts_values = grown_values
+        ts_values[0, :, ts] = self.tau
+        ts_values[1, :, ts] = self.u
+        ts_values[2, :, ts] = self.wl
+        ts_values[3, :, ts] = self.bl
+        n_filled = max(n_filled, ts + 1)
+        veg.hydromorph_ts = ts_values
+        # only the time steps stored so far.
+        veg.tau_ts, veg.u_ts, veg.wl_ts, veg.bl_ts = ts_values[:, :, :n_filled]
 
     def get_hydromorph_values(self, veg):
-        veg.max_tau = np.zeros(len(veg.tau_ts))
-        veg.max_u = np.zeros(len(veg.u_ts))
-        veg.max_wl = np.zeros(len(veg.wl_ts))
-        veg.min_wl = np.zeros(len(veg.wl_ts))
-        veg.bl = np.zeros(len(veg.bl_ts))
-
-        for i in range(0, len(veg.tau_ts)):
-            veg.max_tau[i] = max(veg.tau_ts[i, :])
-            veg.max_u[i] = max(veg.u_ts[i, :])
-            veg.max_wl[i] = max(veg.wl_ts[i, :])
-            veg.min_wl[i] = min(veg.wl_ts[i, :])
-        veg.bl[:] = veg.bl_ts[:, -1]  # last values in bed level to get 'current' value
+        # reduce every cell over the time steps of the ets at once
+        veg.max_tau = veg.tau_ts.max(axis=1)
+        veg.max_u = veg.u_ts.max(axis=1)
+        veg.max_wl = veg.wl_ts.max(axis=1)
+        veg.min_wl = veg.wl_ts.min(axis=1)
+        # last values in bed level to get 'current' value
+        veg.bl = veg.bl_ts[:, -1].copy()
 
     def store_hydromorph_values(self, veg):
         veg.max_tau_prev = veg.max_tau
@@ -48,34 +48,48 @@ class Veg_Mortality(ExtraModel):
         period,
     ):
         """Update vegetation characteristics after mortality"""
-        Veg_Mortality.drowning_hydroperiod(self, veg, constants, ets)
-        Veg_Mortality.uprooting(self, veg, constants)
-        Veg_Mortality.erosion_sedimentation(self, veg, ets)
-
-        veg.juvenile.veg_frac = (
-            veg.juvenile.veg_frac
-            - self.fraction_dead_flood_j
-            - self.fraction_dead_des_j
-            - self.fraction_dead_upr_j
-            - self.burial_scour_j
-        )  # update fractions due to mortality
-        veg.juvenile.veg_frac[
-            veg.juvenile.veg_frac < 0
-        ] = 0  # replace negative values with 0
-        veg.mature.veg_frac = (
-            veg.mature.veg_frac
-            - self.fraction_dead_flood_m
-            - self.fraction_dead_des_m
-            - self.fraction_dead_upr_m
-            - self.burial_scour_m
-        )  # update fractions due to mortality
-        veg.mature.veg_frac[
-            veg.mature.veg_frac < 0
-        ] = 0  # replace negative values with 0
+        if not (veg.juvenile.veg_frac.any() or veg.mature.veg_frac.any()):
+            # no vegetation that can die off, the fractions all stay 0. Only keep
+            # the bed level difference of the ets up to date; the hydroperiod of
+            # this ets is recomputed from wl_prev when it is needed.
+            Veg_Mortality.BedLevel_Dif(self, veg, ets)
+            veg.flooding_prev = veg.drying_prev = None
+        else:
+            Veg_Mortality.drowning_hydroperiod(self, veg, constants, ets)
+            Veg_Mortality.uprooting(self, veg, constants)
+            Veg_Mortality.erosion_sedimentation(self, veg, ets)
+
+            # update fractions due to mortality
+            veg.juvenile.veg_frac = Veg_Mortality.surviving_fraction(
+                veg.juvenile.veg_frac,
+                self.fraction_dead_flood_j,
+                self.fraction_dead_des_j,
+                self.fraction_dead_upr_j,
+                self.burial_scour_j,
+            )
+            veg.mature.veg_frac = Veg_Mortality.surviving_fraction(
+                veg.mature.veg_frac,
+                self.fraction_dead_flood_m,
+                self.fraction_dead_des_m,
+                self.fraction_dead_upr_m,
+                self.burial_scour_m,
+            )
 
         veg.juvenile.update_growth(veg.juvenile.veg_frac, period, begin_date, end_date)
         veg.mature.update_growth(veg.mature.veg_frac, period, begin_date, end_date)
 
+    @staticmethod
+    def surviving_fraction(veg_frac: np.ndarray, *dead_fractions: np.ndarray):
+        """
+        Fraction left after subtracting the dead fractions (in the given order),
+        with negative values replaced by 0. Computed in a single new array,
+        without a temporary per subtraction.
+        """
+        survived = np.subtract(veg_frac, dead_fractions[0])
+        for dead_fraction in dead_fractions[1:]:
+            np.subtract(survived, dead_fraction, out=survived)
+        return np.maximum(survived, 0, out=survived)
+
     def drowning_hydroperiod(
         self, veg: Vegetation, constants: VegetationConstants, ets
     ):
@@ -83,13 +97,19 @@ class Veg_Mortality(ExtraModel):
             veg.wl_ts, constants
         )
 
-        wet = np.zeros(flooding_current.shape)
-        dry = np.zeros(drying_current.shape)
-        wet[flooding_current > 0] = 1
-        dry[drying_current > 0] = 1
+        wet = flooding_current > 0
+        dry = drying_current > 0
         if ets == 0:
             veg.wl_prev = np.zeros(veg.wl_ts.shape)
-        flooding_prev, drying_prev = self.compute_hydroperiod(veg.wl_prev, constants)
+            veg.flooding_prev = veg.drying_prev = None
+        if veg.flooding_prev is None or veg.drying_prev is None:
+            flooding_prev, drying_prev = self.compute_hydroperiod(
+                veg.wl_prev, constants
+            )
+        else:
+            # wl_prev is the previous ets' wl_ts, whose hydroperiod was cached
+            flooding_prev, drying_prev = veg.flooding_prev, veg.drying_prev
+        veg.flooding_prev, veg.drying_prev = flooding_current, drying_current
 
         dry = (
             drying_prev * dry
@@ -98,22 +118,21 @@ class Veg_Mortality(ExtraModel):
             flooding_prev * wet
         )  # deleting all cells that have fallen dry during this ETS
 
-        new_wet = np.where(
-            (flooding_prev == 0) & (flooding_current > 0)
+        new_wet = (flooding_prev == 0) & (
+            flooding_current > 0
         )  # find cells that are newly wet during this ETS
-        new_dry = np.where(
-            (drying_prev == 0) & (drying_current > 0)
+        new_dry = (drying_prev == 0) & (
+            drying_current > 0
         )  # find cells that are newly dry during this ETS
 
-        wet_j = np.ones(veg.juvenile.veg_frac.shape) * wet.reshape(len(wet), 1)
-        # np.repeat(wet.reshape(len(wet), 1), len(veg.juvenile.veg_frac[0]), axis=1)
-        dry_j = np.ones(veg.juvenile.veg_frac.shape) * dry.reshape(len(dry), 1)
-        wet_j[new_wet] = veg.juvenile.veg_frac[
-            new_wet
-        ]  # add initial fractions in cells that are newly wet in matrix
-        dry_j[new_dry] = veg.juvenile.veg_frac[
-            new_dry
-        ]  # add initial fractions in cells that are newly dry in matrix
+        # broadcast the (cells, 1) columns against the life stage fractions,
+        # taking the initial fractions in cells that are newly wet / dry
+        wet = wet.reshape(-1, 1)
+        dry = dry.reshape(-1, 1)
+        new_wet = new_wet.reshape(-1, 1)
+        new_dry = new_dry.reshape(-1, 1)
+        wet_j = np.where(new_wet, veg.juvenile.veg_frac, wet)
+        dry_j = np.where(new_dry, veg.juvenile.veg_frac, dry)
         # determine flooding/drying mortalities based on linear relationship
         mort_flood_j = self.mortality_flood_frequency(
             flooding_current, constants.floMort_thres[0], constants.floMort_slope[0]
@@ -124,14 +143,8 @@ class Veg_Mortality(ExtraModel):
         self.fraction_dead_flood_j = wet_j * mort_flood_j
         self.fraction_dead_des_j = dry_j * mort_des_j
 
-        wet_m = np.ones(veg.mature.veg_frac.shape) * wet.reshape(len(wet), 1)
-        dry_m = np.ones(veg.mature.veg_frac.shape) * dry.reshape(len(dry), 1)
-        wet_m[new_wet] = veg.mature.veg_frac[
-            new_wet
-        ]  # add initial fractions in cells that are newly wet in matrix
-        dry_m[new_dry] = veg.mature.veg_frac[
-            new_dry
-        ]  # add initial fractions in cells that are newly dry in matrix
+        wet_m = np.where(new_wet, veg.mature.veg_frac, wet)
+        dry_m = np.where(new_dry, veg.mature.veg_frac, dry)
         # determine flooding/drying mortalities based on linear relationship
         mort_flood_m = self.mortality_flood_frequency(
             flooding_current, constants.floMort_thres[1], constants.floMort_slope[1]
@@ -145,10 +158,8 @@ class Veg_Mortality(ExtraModel):
     @staticmethod
     def compute_hydroperiod(wl_time, constants: VegetationConstants):
         # determiine cells with water depth > flooding/drying threshold
-        fl = np.where(wl_time > constants.fl_dr)
-        flood = np.zeros(wl_time.shape)
-        flood[fl] = 1
-        flood = flood.sum(axis=1)  # sum up for all time steps in the ets
+        # count them for all time steps in the ets (no scratch buffer needed)
+        flood = np.count_nonzero(wl_time > constants.fl_dr, axis=1)
 
         # compute average flooding and drying period
         flooding_current = flood / constants.ets_duration
@@ -169,16 +180,9 @@ class Veg_Mortality(ExtraModel):
         dmax = round((1 - b) / sl, 2)  # no. of days when 100% is died off
         fct = sl * fl + b  # determines all mortality values over the grid
 
-        out_fl = np.zeros(fl.shape)
-        B = np.where(fl > dmax)  # cells with 100% mortality
-        out_fl[B] = 1
-        a = fl > th
-        b = fl < dmax
-        C = np.nonzero(
-            (a == True) & (b == True)
-        )  # cells where fct applies to determine mortality
-        out_fl[C] = fct[C]
-        return out_fl.reshape(len(out_fl), 1)
+        # single pass: 100% mortality above dmax, linear between th and dmax.
+        out_fl = np.where(fl > dmax, 1.0, np.where((fl > th) & (fl < dmax), fct, 0.0))
+        return out_fl.reshape(-1, 1)
 
     def uprooting(self, veg: Vegetation, constants: VegetationConstants):
         """
@@ -201,25 +205,15 @@ class Veg_Mortality(ExtraModel):
         ETS by resetting them each ETS.
         """
         Veg_Mortality.BedLevel_Dif(self, veg, ets)
-        fract_scour_j = np.zeros(veg.juvenile.root_len.shape)
-        fract_burial_j = np.zeros(veg.juvenile.veg_height.shape)
-        fract_scour_j[
-            self.scour_j > veg.juvenile.root_len
-        ] = 1  # find cells with mortality (scour > rootlength)
-        fract_burial_j[self.burial_j > veg.juvenile.veg_height] = 1
-
+        # cells where vegetation dies (scour > root length or burial > height)
         self.burial_scour_j = (
-            fract_scour_j + fract_burial_j
-        )  # array with cells where vegetation dies and the fraction of death due to burial and scour
-
-        fract_scour_m = np.zeros(veg.mature.root_len.shape)
-        fract_burial_m = np.zeros(veg.mature.veg_height.shape)
-        fract_scour_m[
-            self.scour_m > veg.mature.root_len
-        ] = 1  # find cells with mortality (scour > rootlength)
-        fract_burial_m[self.burial_m > veg.mature.veg_height] = 1
-
-        self.burial_scour_m = fract_scour_m + fract_burial_m
+            (self.scour_j > veg.juvenile.root_len)
+            | (self.burial_j > veg.juvenile.veg_height)
+        ).astype(float)
+        self.burial_scour_m = (
+            (self.scour_m > veg.mature.root_len)
+            | (self.burial_m > veg.mature.veg_height)
+        ).astype(float)
 
     ## TODO make this static method?
     def BedLevel_Dif(self, veg: Vegetation, ets):
@@ -230,39 +224,14 @@ class Veg_Mortality(ExtraModel):
                 depth_dts = veg.bl - veg.bl_prev
                 self.Bl_diff = depth_dts + self.Bl_diff
 
-            self.burial_j = np.zeros(veg.juvenile.veg_height.shape)
-            self.scour_j = np.zeros(veg.juvenile.root_len.shape)
-            self.burial_m = np.zeros(veg.mature.veg_height.shape)
-            self.scour_m = np.zeros(veg.mature.root_len.shape)
-
-            loc_b = np.where(self.Bl_diff < 0)
-            self.burial_j[loc_b] = (
-                np.ones(self.burial_j.shape)
-                * self.Bl_diff[0 : len(self.burial_j)].reshape(
-                    len(self.Bl_diff[0 : len(self.burial_j)]), 1
-                )
-            )[loc_b]
-            self.burial_m[loc_b] = (
-                np.ones(self.burial_m.shape)
-                * self.Bl_diff[0 : len(self.burial_m)].reshape(
-                    len(self.Bl_diff[0 : len(self.burial_m)]), 1
-                )
-            )[loc_b]
-
-            loc_s = np.where(self.Bl_diff > 0)
-            self.scour_j[loc_s] = (
-                np.ones(self.scour_j.shape)
-                * self.Bl_diff[0 : len(self.scour_j)].reshape(
-                    len(self.Bl_diff[0 : len(self.scour_j)]), 1
-                )
-            )[loc_s]
-            self.scour_m[loc_s] = (
-                np.ones(self.scour_m.shape)
-                * self.Bl_diff[0 : len(self.scour_m)].reshape(
-                    len(self.Bl_diff[0 : len(self.scour_m)]), 1
-                )
-            )[loc_s]
-
+            # (cells, 1) column views broadcast over the life stage ages
+            bl_diff = self.Bl_diff.reshape(-1, 1)
+            burial = np.where(bl_diff < 0, bl_diff, 0)
+            scour = np.where(bl_diff > 0, bl_diff, 0)
+            self.burial_j = np.broadcast_to(burial, veg.juvenile.veg_height.shape)
+            self.scour_j = np.broadcast_to(scour, veg.juvenile.root_len.shape)
+            self.burial_m = np.broadcast_to(burial, veg.mature.veg_height.shape)
+            self.scour_m = np.broadcast_to(scour, veg.mature.root_len.shape)
         else:
             self.burial_j = np.zeros(veg.juvenile.veg_height.shape)
             self.scour_j = np.zeros(veg.juvenile.root_len.shape)
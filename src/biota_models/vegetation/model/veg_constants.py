@@ -1,4 +1,6 @@
 import json
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +12,17 @@ from src.core.common.base_constants import BaseConstants
 default_veg_constants_json = Path(__file__).parent / "veg_constants.json"
 
 
+@lru_cache(maxsize=8)
+def _read_veg_constants_json(input_file: Path, modified_ns: int) -> dict:
+    """
+    Reads a vegetation constants json file. Memoized on the file and its
+    modification time, so the constants of every species (and simulation)
+    reading the same file only parse it once.
+    """
+    with open(input_file) as f:
+        return json.load(f)
+
+
 class VegetationConstants(BaseConstants):
     """Object containing all constants used in marsh_model simulations."""
 
@@ -25,7 +38,7 @@ class VegetationConstants(BaseConstants):
     sim_duration: float = 30  # number of morphological years of entire simulation
     start_date: str = "2022-01-01"  # Start date of the simulation
 
-    winter_days: float = list()
+    winter_days: Optional[float] = None
 
     # Colonization
     ColMethod: int = 1  # Colonisation method (1 = on bare substrate between max and min water levels, 2 = on bare substrate with mud content)
@@ -82,63 +95,50 @@ class VegetationConstants(BaseConstants):
             vegetation_constants (dict): Dictionary to fill with the found values.
         """
         species: str = vegetation_constants["species"]
-        with open(vegetation_constants["input_file"]) as f:
-            json_data_dict: dict = json.load(f)
-            vegetation_constants["ColStart"] = json_data_dict[species]["ColStart"]
-            vegetation_constants["ColEnd"] = json_data_dict[species]["ColEnd"]
-            vegetation_constants["random"] = json_data_dict[species]["random"]
-            vegetation_constants["mud_col"] = json_data_dict[species][
-                "mud_colonization"
-            ]
-            vegetation_constants["fl_dr"] = json_data_dict[species]["fl_dr"]
-            vegetation_constants["maxAge"] = json_data_dict[species]["Maximum age"]
-            vegetation_constants["num_ls"] = json_data_dict[species][
-                "Number LifeStages"
-            ]
-            vegetation_constants["iniRoot"] = json_data_dict[species][
-                "initial root length"
-            ]
-            vegetation_constants["iniShoot"] = json_data_dict[species][
-                "initial shoot length"
-            ]
-            vegetation_constants["iniDia"] = json_data_dict[species]["initial diameter"]
-            vegetation_constants["growth_start"] = json_data_dict[species][
-                "start growth period"
-            ]
-            vegetation_constants["growth_end"] = json_data_dict[species][
-                "end growth period"
-            ]
-            vegetation_constants["winter_start"] = json_data_dict[species][
-                "start winter period"
-            ]
-            vegetation_constants["maxGrowth_H"] = json_data_dict[species][
-                "maximum plant height"
-            ]
-            vegetation_constants["maxDia"] = json_data_dict[species]["maximum diameter"]
-            vegetation_constants["maxRoot"] = json_data_dict[species][
-                "maximum root length"
-            ]
-            vegetation_constants["maxYears_LS"] = json_data_dict[species][
-                "maximum years in LifeStage"
-            ]
-            vegetation_constants["num_stem"] = json_data_dict[species]["numStem"]
-            vegetation_constants["iniCol_frac"] = json_data_dict[species]["iniCol_frac"]
-            vegetation_constants["Cd"] = json_data_dict[species]["Cd"]
-            vegetation_constants["desMort_thres"] = json_data_dict[species][
-                "desMort_thres"
-            ]
-            vegetation_constants["desMort_slope"] = json_data_dict[species][
-                "desMort_slope"
-            ]
-            vegetation_constants["floMort_thres"] = json_data_dict[species][
-                "floMort_thres"
-            ]
-            vegetation_constants["floMort_slope"] = json_data_dict[species][
-                "floMort_slope"
-            ]
-            vegetation_constants["vel_thres"] = json_data_dict[species]["vel_thres"]
-            vegetation_constants["vel_slope"] = json_data_dict[species]["vel_slope"]
-            vegetation_constants["maxH_winter"] = json_data_dict[species]["maxH_winter"]
+        input_file = Path(vegetation_constants["input_file"])
+        # copy the (memoized) file content, the constants must not share its lists.
+        json_data_dict: dict = deepcopy(
+            _read_veg_constants_json(input_file, input_file.stat().st_mtime_ns)
+        )
+        vegetation_constants["ColStart"] = json_data_dict[species]["ColStart"]
+        vegetation_constants["ColEnd"] = json_data_dict[species]["ColEnd"]
+        vegetation_constants["random"] = json_data_dict[species]["random"]
+        vegetation_constants["mud_col"] = json_data_dict[species]["mud_colonization"]
+        vegetation_constants["fl_dr"] = json_data_dict[species]["fl_dr"]
+        vegetation_constants["maxAge"] = json_data_dict[species]["Maximum age"]
+        vegetation_constants["num_ls"] = json_data_dict[species]["Number LifeStages"]
+        vegetation_constants["iniRoot"] = json_data_dict[species]["initial root length"]
+        vegetation_constants["iniShoot"] = json_data_dict[species][
+            "initial shoot length"
+        ]
+        vegetation_constants["iniDia"] = json_data_dict[species]["initial diameter"]
+        vegetation_constants["growth_start"] = json_data_dict[species][
+            "start growth period"
+        ]
+        vegetation_constants["growth_end"] = json_data_dict[species][
+            "end growth period"
+        ]
+        vegetation_constants["winter_start"] = json_data_dict[species][
+            "start winter period"
+        ]
+        vegetation_constants["maxGrowth_H"] = json_data_dict[species][
+            "maximum plant height"
+        ]
+        vegetation_constants["maxDia"] = json_data_dict[species]["maximum diameter"]
+        vegetation_constants["maxRoot"] = json_data_dict[species]["maximum root length"]
+        vegetation_constants["maxYears_LS"] = json_data_dict[species][
+            "maximum years in LifeStage"
+        ]
+        vegetation_constants["num_stem"] = json_data_dict[species]["numStem"]
+        vegetation_constants["iniCol_frac"] = json_data_dict[species]["iniCol_frac"]
+        vegetation_constants["Cd"] = json_data_dict[species]["Cd"]
+        vegetation_constants["desMort_thres"] = json_data_dict[species]["desMort_thres"]
+        vegetation_constants["desMort_slope"] = json_data_dict[species]["desMort_slope"]
+        vegetation_constants["floMort_thres"] = json_data_dict[species]["floMort_thres"]
+        vegetation_constants["floMort_slope"] = json_data_dict[species]["floMort_slope"]
+        vegetation_constants["vel_thres"] = json_data_dict[species]["vel_thres"]
+        vegetation_constants["vel_slope"] = json_data_dict[species]["vel_slope"]
+        vegetation_constants["maxH_winter"] = json_data_dict[species]["maxH_winter"]
 
     @staticmethod
     def get_duration(start_date, end_date):
@@ -150,6 +150,40 @@ class VegetationConstants(BaseConstants):
     def ets_duration(self):
         return round(365 / self.t_eco_year)
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_date_in_year(date: str, year: int) -> pd.Timestamp:
+        """
+        Gets the (month and day of the) given date in the given year. The dates are
+        only parsed once per year, as every ets of the year asks for them.
+
+        Args:
+            date (str): Date to take the month and day from (e.g. `growth_start`).
+            year (int): Year of the resulting date.
+
+        Returns:
+            pd.Timestamp: The date in the given year.
+        """
+        return pd.to_datetime(date).replace(year=year)
+
+    def in_colonization_period(self, begin_date, end_date, period) -> bool:
+        """
+        Whether the (daily) period of an ets has days from the start of the
+        colonization period on, and days up to its end.
+
+        Args:
+            begin_date (pd.Timestamp): Begin date of the ets.
+            end_date (pd.Timestamp): End date of the ets.
+            period (pd.DatetimeIndex): Sorted (daily) dates of the ets.
+
+        Returns:
+            bool: Whether colonization happens in the ets.
+        """
+        col_start = self.get_date_in_year(self.ColStart, begin_date.year)
+        col_end = self.get_date_in_year(self.ColEnd, end_date.year)
+        # the period is sorted, so only its first and last day need comparing.
+        return period[-1] >= col_start and period[0] <= col_end
+
     # @property
     # def growth_days(self):
     #         """
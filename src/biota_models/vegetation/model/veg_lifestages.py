@@ -24,9 +24,9 @@ class LifeStages(ExtraModel):
     stem_num: VegAttribute = None  # number of stems
     cover: VegAttribute = None  # vegetation fraction of all ages
 
-    dt_height: VegAttribute = list()
-    dt_root: VegAttribute = list()
-    dt_stemdia: VegAttribute = list()
+    dt_height: Optional[VegAttribute] = None
+    dt_root: Optional[VegAttribute] = None
+    dt_stemdia: Optional[VegAttribute] = None
     winter: VegAttribute = False
 
     def __repr__(self):
@@ -129,24 +129,28 @@ class LifeStages(ExtraModel):
         if self.constants.num_ls < self.ls:
             pass
         else:
-            winter_start = pd.to_datetime(self.constants.winter_start).replace(
-                year=begin_date.year
+            get_date_in_year = self.constants.get_date_in_year
+            winter_start = get_date_in_year(
+                self.constants.winter_start, begin_date.year
             )
-            start_growth = pd.to_datetime(self.constants.growth_start).replace(
-                year=begin_date.year
+            start_growth = get_date_in_year(
+                self.constants.growth_start, begin_date.year
             )
-            end_growth = pd.to_datetime(self.constants.growth_end).replace(
-                year=begin_date.year
+            end_growth = get_date_in_year(self.constants.growth_end, begin_date.year)
+
+            # number of days of the period within the growth season
+            period = pd.to_datetime(period)
+            growth_days = np.count_nonzero(
+                (start_growth <= period) & (period <= end_growth)
             )
 
-            a = start_growth <= pd.to_datetime(period)
-            b = pd.to_datetime(period) <= end_growth
-            c = np.nonzero((a == True) & (b == True))
-            growth_days = len(c[0])
+            # veg_frac is not modified below, so evaluate its masks only once.
+            alive = veg_frac > 0
+            dead = veg_frac == 0
 
             if begin_date <= winter_start <= end_date:
                 self.winter = True
-                self.veg_height[veg_frac == 0] = 0  # delete vegetation which died
+                self.veg_height[dead] = 0  # delete vegetation which died
                 self.veg_height[
                     self.constants.maxH_winter[self.ls - 1] < self.veg_height
                 ] = self.constants.maxH_winter[
@@ -155,23 +159,19 @@ class LifeStages(ExtraModel):
 
             else:
                 self.winter = False
-                self.veg_height[veg_frac > 0] = self.veg_height[veg_frac > 0] + (
+                self.veg_height[alive] = self.veg_height[alive] + (
                     self.dt_height[0] * growth_days
                 )
-                self.veg_height[veg_frac == 0] = 0
+                self.veg_height[dead] = 0
 
-            self.stem_dia[veg_frac > 0] = self.stem_dia[veg_frac > 0] + (
+            self.stem_dia[alive] = self.stem_dia[alive] + (
                 self.dt_stemdia * growth_days
             )
-            self.stem_dia[veg_frac == 0] = 0
-            self.root_len[veg_frac > 0] = self.root_len[veg_frac > 0] + (
-                self.dt_root * growth_days
-            )
-            self.root_len[veg_frac == 0] = 0
-            self.stem_num[veg_frac > 0] = self.constants.num_stem[self.ls - 1]
-            self.stem_num[veg_frac == 0] = 0
-            self.veg_age[veg_frac > 0] = (
-                self.veg_age[veg_frac > 0] + self.constants.ets_duration
-            )
-            self.veg_age[veg_frac == 0] = 0
+            self.stem_dia[dead] = 0
+            self.root_len[alive] = self.root_len[alive] + (self.dt_root * growth_days)
+            self.root_len[dead] = 0
+            self.stem_num[alive] = self.constants.num_stem[self.ls - 1]
+            self.stem_num[dead] = 0
+            self.veg_age[alive] = self.veg_age[alive] + self.constants.ets_duration
+            self.veg_age[dead] = 0
             self.cover = veg_frac.sum(axis=1).reshape(-1, 1)
@@ -1,7 +1,6 @@
 from typing import Optional, Union
 
 import numpy as np
-import pandas as pd
 from pydantic import root_validator
 
 from src.biota_models.vegetation.model.veg_constants import VegetationConstants
@@ -44,9 +43,9 @@ class Vegetation(Biota):
         return values
 
     # time related values
-    growth_duration: pd.Timedelta = None
-    col_duration: pd.Timedelta = None
-    winter_duration: pd.Timedelta = None
+    growth_duration: Optional[int] = None  # [days]
+    col_duration: Optional[int] = None  # [days]
+    winter_duration: Optional[int] = None  # [days]
     # growth_days: VegAttribute = list()
     # growth_Day: VegAttribute = list()
     # col_days: VegAttribute = list()
@@ -64,10 +63,15 @@ class Vegetation(Biota):
     min_wl_prev: Optional[VegAttribute] = None
     bl_prev: Optional[VegAttribute] = None
     wl_prev: Optional[VegAttribute] = None
+    flooding_prev: Optional[VegAttribute] = None
+    drying_prev: Optional[VegAttribute] = None
     tau_ts: Optional[VegAttribute] = None
     u_ts: Optional[VegAttribute] = None
     wl_ts: Optional[VegAttribute] = None
     bl_ts: Optional[VegAttribute] = None
+    # (tau, u, wl, bl) per cell and time step of the ets, the *_ts values are its
+    # stored time steps.
+    hydromorph_ts: Optional[np.ndarray] = None
 
     # @validator("_cover")
     # @classmethod
@@ -87,51 +91,50 @@ class Vegetation(Biota):
     @property
     def veg_den(self):  # as input for DFM
         """stem density in number of stems per m2, according to area fraction of veg age"""
-        return (self.juvenile.stem_num * self.juvenile.veg_frac).sum(axis=1) + (
-            self.mature.stem_num * self.mature.veg_frac
-        ).sum(axis=1)
+        # einsum multiplies and sums over the ages without a product temporary.
+        stem_density = np.einsum(
+            "ij,ij->i", self.juvenile.stem_num, self.juvenile.veg_frac
+        )
+        stem_density += np.einsum(
+            "ij,ij->i", self.mature.stem_num, self.mature.veg_frac
+        )
+        return stem_density
 
     @property
     def av_stemdia(self):  # as input for DFM
         """average stem diameter of the different vegetation in one grid cell"""
-        cover_j = self.juvenile.cover.copy()
-        cover_m = self.mature.cover.copy()
-        cover_j[cover_j == 0] = 1
-        cover_m[cover_m == 0] = 1
-        # if self.juvenile.cover.all() == 0 and self.mature.cover.all() == 0:
-        #     return np.zeros(self.cover.shape)
-        # elif self.mature.cover.all() == 0:
-        #     return (self.juvenile.stem_dia * self.juvenile.veg_frac).sum(axis=1) / self.juvenile.cover
-        # elif self.juvenile.cover.all() == 0:
-        #     return (self.mature.stem_dia * self.mature.veg_frac).sum(axis=1) / self.mature.cover
-        # else:
-        return (self.juvenile.stem_dia * self.juvenile.veg_frac).sum(axis=1).reshape(
-            -1, 1
-        ) / cover_j + (self.mature.stem_dia * self.mature.veg_frac).sum(axis=1).reshape(
-            -1, 1
-        ) / cover_m
+        return self.get_cover_weighted_average("stem_dia")
 
     @property
     def av_height(self):  # as input for DFM
         """average shoot height of the different vegetation in one grid cell"""
-        cover_j = self.juvenile.cover.copy()
-        cover_m = self.mature.cover.copy()
-        cover_j[cover_j == 0] = 1
-        cover_m[cover_m == 0] = 1
-        # if np.all(self.juvenile.cover == 0) and np.all(self.mature.cover == 0):
-        #     return np.zeros(self.cover.shape)
-        # elif np.all(self.mature.cover == 0):
-        #     return (self.juvenile.veg_height * self.juvenile.veg_frac).sum(axis=1) / (self.juvenile.cover[self.juvenile.cover == 0]=1)
-        # elif self.juvenile.cover.all() == 0:
-        #     return (self.mature.veg_height * self.mature.veg_frac).sum(axis=1) / self.mature.cover
-        # else:
-        return (self.juvenile.veg_height * self.juvenile.veg_frac).sum(axis=1).reshape(
-            -1, 1
-        ) / cover_j + (self.mature.veg_height * self.mature.veg_frac).sum(
-            axis=1
-        ).reshape(
-            -1, 1
-        ) / cover_m
+        return self.get_cover_weighted_average("veg_height")
+
+    def get_cover_weighted_average(self, attribute: str) -> np.ndarray:
+        """
+        Sum over the life stages of the fraction weighted average (over the ages)
+        of the given life stage attribute, cells without cover count as 0.
+
+        Args:
+            attribute (str): Name of the `LifeStages` attribute to average.
+
+        Returns:
+            np.ndarray: (cells, 1) averages.
+        """
+
+        def get_average(life_stage: LifeStages) -> np.ndarray:
+            average = np.einsum(
+                "ij,ij->i", getattr(life_stage, attribute), life_stage.veg_frac
+            )
+            # divide the new (cells, 1) sums in place, only where there is cover.
+            # Cells without cover have no fraction, so their sum stays 0.
+            average = average.reshape(-1, 1)
+            cover = life_stage.cover
+            return np.divide(average, cover, out=average, where=cover != 0)
+
+        average = get_average(self.juvenile)
+        average += get_average(self.mature)
+        return average
 
     # def duration_growth(self, constants):
     #     """duration of the growth period from start, end growth from Constants"""
@@ -174,36 +177,25 @@ class Vegetation(Biota):
             self.initial.stem_dia = np.zeros(self.initial.veg_height.shape)
             self.initial.root_len = np.zeros(self.initial.veg_height.shape)
             self.initial.stem_num = np.zeros(self.initial.veg_height.shape)
-            self.juvenile.veg_frac = np.delete(
-                self.juvenile.veg_frac,
-                np.where(np.all(self.juvenile.veg_frac == 0, axis=0) == True),
-                1,
-            )
-            self.juvenile.veg_height = np.delete(
-                self.juvenile.veg_height,
-                np.where(np.all(self.juvenile.veg_height == 0, axis=0) == True),
-                1,
-            )
-            self.juvenile.veg_age = np.delete(
-                self.juvenile.veg_age,
-                np.where(np.all(self.juvenile.stem_dia == 0, axis=0) == True),
-                1,
-            )
-            self.juvenile.stem_dia = np.delete(
-                self.juvenile.stem_dia,
-                np.where(np.all(self.juvenile.stem_dia == 0, axis=0) == True),
-                1,
-            )
-            self.juvenile.root_len = np.delete(
-                self.juvenile.root_len,
-                np.where(np.all(self.juvenile.root_len == 0, axis=0) == True),
-                1,
-            )
-            self.juvenile.stem_num = np.delete(
-                self.juvenile.stem_num,
-                np.where(np.all(self.juvenile.stem_num == 0, axis=0) == True),
-                1,
-            )
+            # keep only the age columns with any (non-zero) value
+            self.juvenile.veg_frac = self.juvenile.veg_frac[
+                :, self.juvenile.veg_frac.any(axis=0)
+            ]
+            self.juvenile.veg_height = self.juvenile.veg_height[
+                :, self.juvenile.veg_height.any(axis=0)
+            ]
+            self.juvenile.veg_age = self.juvenile.veg_age[
+                :, self.juvenile.stem_dia.any(axis=0)
+            ]
+            self.juvenile.stem_dia = self.juvenile.stem_dia[
+                :, self.juvenile.stem_dia.any(axis=0)
+            ]
+            self.juvenile.root_len = self.juvenile.root_len[
+                :, self.juvenile.root_len.any(axis=0)
+            ]
+            self.juvenile.stem_num = self.juvenile.stem_num[
+                :, self.juvenile.stem_num.any(axis=0)
+            ]
             self.juvenile.cover = self.juvenile.veg_frac.sum(axis=1).reshape(-1, 1)
 
         if self.species == "Salicornia" and self.juvenile.winter == True:
@@ -244,36 +236,25 @@ class Vegetation(Biota):
             self.juvenile.stem_num = np.delete(self.juvenile.stem_num, -1, 1)
             self.juvenile.veg_age = np.delete(self.juvenile.veg_age, -1, 1)
             self.juvenile.cover = self.juvenile.veg_frac.sum(axis=1).reshape(-1, 1)
-            self.mature.veg_frac = np.delete(
-                self.mature.veg_frac,
-                np.where(np.all(self.mature.veg_frac == 0, axis=0) == True),
-                1,
-            )
-            self.mature.veg_height = np.delete(
-                self.mature.veg_height,
-                np.where(np.all(self.mature.veg_height == 0, axis=0) == True),
-                1,
-            )
-            self.mature.veg_age = np.delete(
-                self.mature.veg_age,
-                np.where(np.all(self.mature.stem_dia == 0, axis=0) == True),
-                1,
-            )
-            self.mature.stem_dia = np.delete(
-                self.mature.stem_dia,
-                np.where(np.all(self.mature.stem_dia == 0, axis=0) == True),
-                1,
-            )
-            self.mature.root_len = np.delete(
-                self.mature.root_len,
-                np.where(np.all(self.mature.root_len == 0, axis=0) == True),
-                1,
-            )
-            self.mature.stem_num = np.delete(
-                self.mature.stem_num,
-                np.where(np.all(self.mature.stem_num == 0, axis=0) == True),
-                1,
-            )
+            # keep only the age columns with any (non-zero) value
+            self.mature.veg_frac = self.mature.veg_frac[
+                :, self.mature.veg_frac.any(axis=0)
+            ]
+            self.mature.veg_height = self.mature.veg_height[
+                :, self.mature.veg_height.any(axis=0)
+            ]
+            self.mature.veg_age = self.mature.veg_age[
+                :, self.mature.stem_dia.any(axis=0)
+            ]
+            self.mature.stem_dia = self.mature.stem_dia[
+                :, self.mature.stem_dia.any(axis=0)
+            ]
+            self.mature.root_len = self.mature.root_len[
+                :, self.mature.root_len.any(axis=0)
+            ]
+            self.mature.stem_num = self.mature.stem_num[
+                :, self.mature.stem_num.any(axis=0)
+            ]
             self.mature.cover = self.mature.veg_frac.sum(axis=1).reshape(-1, 1)
 
         elif np.any(self.juvenile.veg_age > (self.constants.maxAge * 365)):
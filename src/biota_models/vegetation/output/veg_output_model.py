@@ -47,6 +47,8 @@ class VegetationMapOutput(_VegetationOutput):
         """Initiate mapping output file in which output covering the whole model domain is stored every period of running."""
         if not self.valid_output():
             return
+        # the file is recreated, close a dataset kept open for its updates.
+        self.close()
         # Open netcdf data and initialize needed variables.
         with Dataset(self.output_filepath, "w", format="NETCDF4") as _map_data:
             _map_data.description = "Mapped simulation data of the VegetationModel."
@@ -77,70 +79,84 @@ class VegetationMapOutput(_VegetationOutput):
             x[:] = self.xy_coordinates[:, 0]
             y[:] = self.xy_coordinates[:, 1]
 
+            # time-varying variables in chunks of whole (per ets) writes, compressed.
+            variable_settings = self.get_variable_settings(self.space)
+            # the age fractions are written one (space, age) slab per ets, chunked
+            # over enough ages for a chunk of at least 64 KB.
+            n_age_chunk, _ = self.get_chunksizes(self.space)
+            fraction_settings = dict(
+                variable_settings, chunksizes=(self.space, n_age_chunk, 1)
+            )
+
             # initial conditions
             # Definition of methods to initialize the netcdf variables.
 
             def init_hydro_mor():
                 max_tau = _map_data.createVariable(
-                    "max_tau", "f8", ("time", "nmesh2d_face")
+                    "max_tau", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 max_tau.long_name = "maximum bed shear stress"
                 max_tau.units = "N/m^2"
                 max_tau[:, :] = 0
                 max_u = _map_data.createVariable(
-                    "max_u", "f8", ("time", "nmesh2d_face")
+                    "max_u", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 max_u.long_name = "maximum flow velocity"
                 max_u.units = "m/s"
                 max_u[:, :] = 0
                 max_wl = _map_data.createVariable(
-                    "max_wl", "f8", ("time", "nmesh2d_face")
+                    "max_wl", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 max_wl.long_name = "maximum water level"
                 max_wl.units = "m"
                 max_wl[:, :] = 0
                 min_wl = _map_data.createVariable(
-                    "min_wl", "f8", ("time", "nmesh2d_face")
+                    "min_wl", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 min_wl.long_name = "minimum water level"
                 min_wl.units = "m"
                 min_wl[:, :] = 0
-                bl = _map_data.createVariable("bl", "f8", ("time", "nmesh2d_face"))
+                bl = _map_data.createVariable(
+                    "bl", "f8", ("time", "nmesh2d_face"), **variable_settings
+                )
                 bl.long_name = "bedlevel"
                 bl.units = "m"
                 bl[:, :] = 0
 
             def init_veg_characteristics():
                 cover = _map_data.createVariable(
-                    "cover", "f8", ("time", "nmesh2d_face")
+                    "cover", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 cover.long_name = "sum of fraction coverage in each cell (for all ages)"
                 cover.units = "-"
                 cover[:, :] = 0  # could be =veg.cover if there is an initial one
 
                 height = _map_data.createVariable(
-                    "height", "f8", ("time", "nmesh2d_face")
+                    "height", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 height.long_name = "vegetation height"
                 height.units = "m"
                 height[:, :] = 0
 
                 diaveg = _map_data.createVariable(
-                    "diaveg", "f8", ("time", "nmesh2d_face")
+                    "diaveg", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 diaveg.long_name = "stem diameter"
                 diaveg.units = "m"
                 diaveg[:, :] = 0
 
                 rnveg = _map_data.createVariable(
-                    "rnveg", "f8", ("time", "nmesh2d_face")
+                    "rnveg", "f8", ("time", "nmesh2d_face"), **variable_settings
                 )
                 rnveg.long_name = "vegetation density"
                 diaveg.units = "1/m2"
                 diaveg[:, :] = 0
 
                 veg_frac_j = _map_data.createVariable(
-                    "veg_frac_j", "f8", ("nmesh2d_face", "age", "time")
+                    "veg_frac_j",
+                    "f8",
+                    ("nmesh2d_face", "age", "time"),
+                    **fraction_settings,
                 )
                 veg_frac_j.long_name = (
                     "Vegetation fraction in each growth day for juvenile"
@@ -148,7 +164,10 @@ class VegetationMapOutput(_VegetationOutput):
                 veg_frac_j.units = "-"
                 veg_frac_j[:, :, :] = 0
                 veg_frac_m = _map_data.createVariable(
-                    "veg_frac_m", "f8", ("nmesh2d_face", "age", "time")
+                    "veg_frac_m",
+                    "f8",
+                    ("nmesh2d_face", "age", "time"),
+                    **fraction_settings,
                 )
                 veg_frac_m.long_name = (
                     "Vegetation fraction in each growth day for mature"
@@ -161,7 +180,7 @@ class VegetationMapOutput(_VegetationOutput):
                 veg_characteristics=init_veg_characteristics,
             )
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
 
     def update(self, veg: Vegetation, end_time: int, ets, year, constants):
@@ -175,32 +194,34 @@ class VegetationMapOutput(_VegetationOutput):
         """
         if not self.valid_output():
             return
-        with Dataset(self.output_filepath, mode="a") as _map_data:
+        with self.append_dataset() as _map_data:
+            # the variables by name, without the dataset (path) lookup.
+            _map_vars = _map_data.variables
             i = ets + constants.t_eco_year * year
 
-            _map_data["time"][i] = end_time
+            _map_vars["time"][i] = end_time
 
             def update_hydro_mor():
-                _map_data["max_tau"][-1, :] = veg.max_tau
-                _map_data["max_u"][-1, :] = veg.max_u
-                _map_data["max_wl"][-1, :] = veg.max_wl
-                _map_data["min_wl"][-1, :] = veg.min_wl
-                _map_data["bl"][-1, :] = veg.bl
+                _map_vars["max_tau"][-1, :] = veg.max_tau
+                _map_vars["max_u"][-1, :] = veg.max_u
+                _map_vars["max_wl"][-1, :] = veg.max_wl
+                _map_vars["min_wl"][-1, :] = veg.min_wl
+                _map_vars["bl"][-1, :] = veg.bl
 
             def update_veg_characteristics():
-                _map_data["cover"][-1, :] = veg.total_cover.transpose()
-                _map_data["height"][-1, :] = veg.av_height.transpose()
-                _map_data["diaveg"][-1, :] = veg.av_stemdia.transpose()
-                _map_data["rnveg"][-1, :] = veg.veg_den.transpose()
-                _map_data["veg_frac_j"][:, :, -1] = veg.juvenile.veg_frac[:, :]
-                _map_data["veg_frac_m"][:, :, -1] = veg.mature.veg_frac[:, :]
+                _map_vars["cover"][-1, :] = veg.total_cover.transpose()
+                _map_vars["height"][-1, :] = veg.av_height.transpose()
+                _map_vars["diaveg"][-1, :] = veg.av_stemdia.transpose()
+                _map_vars["rnveg"][-1, :] = veg.veg_den.transpose()
+                _map_vars["veg_frac_j"][:, :, -1] = veg.juvenile.veg_frac[:, :]
+                _map_vars["veg_frac_m"][:, :, -1] = veg.mature.veg_frac[:, :]
 
             conditions_funct = dict(
                 hydro_mor=update_hydro_mor,
                 veg_characteristics=update_veg_characteristics,
             )
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
 
 
@@ -219,6 +240,8 @@ class VegetationHisOutput(_VegetationOutput):
         self.output_filename = "VegModel_" + veg.species + "_his.nc"
         if not self.valid_output():
             return
+        # the file is recreated, close a dataset kept open for its updates.
+        self.close()
         with Dataset(self.output_filepath, "w", format="NETCDF4") as _his_data:
             _his_data.description = "Historic simulation data of the VegetaionModel"
 
@@ -238,55 +261,76 @@ class VegetationHisOutput(_VegetationOutput):
             x[:] = self.xy_stations[:, 0]
             y[:] = self.xy_stations[:, 1]
 
+            # time-varying variables in chunks of whole (per ets) writes, compressed.
+            variable_settings = self.get_variable_settings(
+                len(self.xy_stations), veg.constants.ets_duration
+            )
+
             def init_hydro_mor():
                 max_tau = _his_data.createVariable(
-                    "max_tau", "f8", ("time", "stations")
+                    "max_tau", "f8", ("time", "stations"), **variable_settings
                 )
                 max_tau.long_name = "maximum bed shear stress"
                 max_tau.units = "N/m^2"
                 max_tau[:, :] = 0
-                max_u = _his_data.createVariable("max_u", "f8", ("time", "stations"))
+                max_u = _his_data.createVariable(
+                    "max_u", "f8", ("time", "stations"), **variable_settings
+                )
                 max_u.long_name = "maximum flow velocity"
                 max_u.units = "m/s"
                 max_u[:, :] = 0
-                max_wl = _his_data.createVariable("max_wl", "f8", ("time", "stations"))
+                max_wl = _his_data.createVariable(
+                    "max_wl", "f8", ("time", "stations"), **variable_settings
+                )
                 max_wl.long_name = "maximum water level"
                 max_wl.units = "m"
                 max_wl[:, :] = 0
-                min_wl = _his_data.createVariable("min_wl", "f8", ("time", "stations"))
+                min_wl = _his_data.createVariable(
+                    "min_wl", "f8", ("time", "stations"), **variable_settings
+                )
                 min_wl.long_name = "minimum water level"
                 min_wl.units = "m"
                 min_wl[:, :] = 0
-                bl = _his_data.createVariable("bl", "f8", ("time", "stations"))
+                bl = _his_data.createVariable(
+                    "bl", "f8", ("time", "stations"), **variable_settings
+                )
                 bl.long_name = "bedlevel"
                 bl.units = "m"
                 bl[:, :] = 0
 
             def init_veg_characteristics():
-                cover = _his_data.createVariable("cover", "f8", ("time", "stations"))
+                cover = _his_data.createVariable(
+                    "cover", "f8", ("time", "stations"), **variable_settings
+                )
                 cover.long_name = "sum of fraction coverage in each cell (for all ages)"
                 cover.units = "-"
                 cover[
                     :, :
                 ] = veg.total_cover  # could be =veg.cover if there is an initial one
 
-                height = _his_data.createVariable("height", "f8", ("time", "stations"))
+                height = _his_data.createVariable(
+                    "height", "f8", ("time", "stations"), **variable_settings
+                )
                 height.long_name = "vegetation height"
                 height.units = "m"
                 height[:, :] = 0
 
-                diaveg = _his_data.createVariable("diaveg", "f8", ("time", "stations"))
+                diaveg = _his_data.createVariable(
+                    "diaveg", "f8", ("time", "stations"), **variable_settings
+                )
                 diaveg.long_name = "stem diameter"
                 diaveg.units = "m"
                 diaveg[:, :] = 0
 
-                rnveg = _his_data.createVariable("rnveg", "f8", ("time", "stations"))
+                rnveg = _his_data.createVariable(
+                    "rnveg", "f8", ("time", "stations"), **variable_settings
+                )
                 rnveg.long_name = "vegetation density"
                 diaveg.units = "1/m2"
                 diaveg[:, :] = 0
 
                 veg_frac_j = _his_data.createVariable(
-                    "veg_frac_j", "f8", ("time", "stations")
+                    "veg_frac_j", "f8", ("time", "stations"), **variable_settings
                 )
                 veg_frac_j.long_name = (
                     "Vegetation fraction in each growth day for juvenile"
@@ -294,7 +338,7 @@ class VegetationHisOutput(_VegetationOutput):
                 veg_frac_j.units = "-"
                 veg_frac_j[:, :] = 0
                 veg_frac_m = _his_data.createVariable(
-                    "veg_frac_m", "f8", ("time", "stations")
+                    "veg_frac_m", "f8", ("time", "stations"), **variable_settings
                 )
                 veg_frac_m.long_name = (
                     "Vegetation fraction in each growth day for mature"
@@ -307,7 +351,7 @@ class VegetationHisOutput(_VegetationOutput):
                 veg_characteristics=init_veg_characteristics,
             )
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
 
     def update(self, veg: Vegetation, dates: DataFrame):
@@ -321,46 +365,48 @@ class VegetationHisOutput(_VegetationOutput):
         """
         if not self.valid_output():
             return
-        with Dataset(self.output_filepath, mode="a") as _his_data:
+        with self.append_dataset() as _his_data:
+            # the variables by name, without the dataset (path) lookup.
+            _his_vars = _his_data.variables
             y_dates = dates.reset_index(drop=True)
-            ti = ((y_dates - self.first_date).squeeze()).dt.days.values
-            _his_data["time"][ti[:]] = y_dates.values
+            ti = self.get_time_index(
+                ((y_dates - self.first_date).squeeze()).dt.days.values
+            )
+            _his_vars["time"][ti] = y_dates.values
 
             def update_hydro_mor():
-                _his_data["max_tau"][ti, :] = np.tile(veg.max_tau, (len(y_dates), 1))[
+                _his_vars["max_tau"][ti, :] = np.atleast_2d(veg.max_tau)[
                     :, self.idx_stations
                 ]
-                _his_data["max_u"][ti, :] = np.tile(veg.max_u, (len(y_dates), 1))[
+                _his_vars["max_u"][ti, :] = np.atleast_2d(veg.max_u)[
                     :, self.idx_stations
                 ]
-                _his_data["max_wl"][ti, :] = np.tile(veg.max_wl, (len(y_dates), 1))[
+                _his_vars["max_wl"][ti, :] = np.atleast_2d(veg.max_wl)[
                     :, self.idx_stations
                 ]
-                _his_data["min_wl"][ti, :] = np.tile(veg.min_wl, (len(y_dates), 1))[
-                    :, self.idx_stations
-                ]
-                _his_data["bl"][ti, :] = np.tile(veg.bl, (len(y_dates), 1))[
+                _his_vars["min_wl"][ti, :] = np.atleast_2d(veg.min_wl)[
                     :, self.idx_stations
                 ]
+                _his_vars["bl"][ti, :] = np.atleast_2d(veg.bl)[:, self.idx_stations]
 
             def update_veg_characteristics():
-                _his_data["cover"][ti, :] = np.tile(
-                    veg.total_cover.transpose(), (len(y_dates), 1)
-                )[:, self.idx_stations]
-                _his_data["height"][ti, :] = np.tile(
-                    veg.av_height.transpose(), (len(y_dates), 1)
-                )[:, self.idx_stations]
-                _his_data["diaveg"][ti, :] = np.tile(
-                    veg.av_stemdia.transpose(), (len(y_dates), 1)
-                )[:, self.idx_stations]
-                _his_data["rnveg"][ti, :] = np.tile(
-                    veg.veg_den.transpose(), (len(y_dates), 1)
-                )[:, self.idx_stations]
-                _his_data["veg_frac_j"][ti, :] = np.tile(
-                    veg.juvenile.cover.transpose(), (len(y_dates), 1)
+                _his_vars["cover"][ti, :] = np.atleast_2d(veg.total_cover.transpose())[
+                    :, self.idx_stations
+                ]
+                _his_vars["height"][ti, :] = np.atleast_2d(veg.av_height.transpose())[
+                    :, self.idx_stations
+                ]
+                _his_vars["diaveg"][ti, :] = np.atleast_2d(veg.av_stemdia.transpose())[
+                    :, self.idx_stations
+                ]
+                _his_vars["rnveg"][ti, :] = np.atleast_2d(veg.veg_den.transpose())[
+                    :, self.idx_stations
+                ]
+                _his_vars["veg_frac_j"][ti, :] = np.atleast_2d(
+                    veg.juvenile.cover.transpose()
                 )[:, self.idx_stations]
-                _his_data["veg_frac_m"][ti, :] = np.tile(
-                    veg.mature.cover.transpose(), (len(y_dates), 1)
+                _his_vars["veg_frac_m"][ti, :] = np.atleast_2d(
+                    veg.mature.cover.transpose()
                 )[:, self.idx_stations]
 
             conditions_funct = dict(
@@ -369,5 +415,5 @@ class VegetationHisOutput(_VegetationOutput):
             )
 
             for key, v_func in conditions_funct.items():
-                if self.output_params.dict()[key]:
+                if getattr(self.output_params, key):
                     v_func()
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from datetime import timedelta
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -139,15 +138,14 @@ class _VegetationSimulation(BaseSimulation, ABC):
         Generates the required directories if they do not exist already.
         """
         loop_dirs: List[Path] = [
-            "working_dir",
-            "output_dir",
-            "input_dir",
-            "figures_dir",
+            self.working_dir,
+            self.output_dir,
+            self.input_dir,
+            self.figures_dir,
         ]
-        for loop_dir in loop_dirs:
-            value_dir: Path = getattr(self, loop_dir)
-            if not value_dir.is_dir():
-                value_dir.mkdir(parents=True)
+        for value_dir in loop_dirs:
+            # an existing directory is kept, without checking for it first.
+            value_dir.mkdir(parents=True, exist_ok=True)
 
     def initiate(
         self,
@@ -194,12 +192,10 @@ class _VegetationSimulation(BaseSimulation, ABC):
         self.biota.juvenile.initiate_vegetation_characteristics()
         self.biota.mature.initiate_vegetation_characteristics()
 
-        if self.output.defined:
-            self.output.initialize(self.biota)
-        else:
-            print("WARNING: No output defined, so none exported.")
-
+        # initialize the output once, it recreates the output files.
         self.output.initialize(self.biota)
+        if not self.output.defined:
+            print("WARNING: No output defined, so none exported.")
 
     def run(self, duration: Optional[int] = None):
         """Run simulation.
@@ -214,40 +210,42 @@ class _VegetationSimulation(BaseSimulation, ABC):
         if duration is None:
             duration = int(self.constants.sim_duration)
         start_date = pd.to_datetime(self.constants.start_date)
-        years = range(
-            int(start_date.year),
-            int(start_date.year + duration),
-        )  # takes the starting year from the start date defined in the Constants class.
-
-        with tqdm(range((int(duration)))) as progress:
+        # (begin) dates of all the ets of the run, each ets lasting the same days,
+        # starting from the start date defined in the Constants class.
+        ets_days = round(365 / self.constants.t_eco_year)
+        ets_dates = pd.date_range(
+            pd.Timestamp(
+                year=start_date.year, month=start_date.month, day=start_date.day
+            ),
+            periods=duration * self.constants.t_eco_year + 1,
+            freq=pd.Timedelta(days=ets_days),
+        )
+
+        # the bio processes keep their state on the object between the ets (e.g.
+        # the bed level difference), so create them once for the whole run.
+        hydro_mor = Hydro_Morphodynamics()
+        mort = Veg_Mortality()
+        col = Colonization()
+        # the output files are closed when leaving the run, also when it fails.
+        with self.output, tqdm(range((int(duration)))) as progress:
             for i in progress:
-                current_year = years[i]
                 for ets in range(0, self.constants.t_eco_year):
-                    if ets == 0 and i == 0:
-                        begin_date = pd.Timestamp(
-                            year=current_year,
-                            month=start_date.month,
-                            day=start_date.day,
-                        )
-                    else:
-                        begin_date = end_date
-                    end_date = begin_date + timedelta(
-                        days=round(365 / self.constants.t_eco_year)
-                    )
-                    period = [
-                        begin_date + timedelta(n)
-                        for n in range(int((end_date - begin_date).days))
-                    ]
+                    begin_date = ets_dates[i * self.constants.t_eco_year + ets]
+                    end_date = ets_dates[i * self.constants.t_eco_year + ets + 1]
+                    # daily dates of the ets
+                    period = pd.date_range(begin_date, periods=ets_days)
 
                     # # set dimensions (i.e. update time-dimension)
-                    RESHAPE().time = len(pd.DataFrame(period))
+                    RESHAPE().time = len(period)
 
+                    # shown once per ets, repainting the progress bar every time
+                    # step would slow down the (short) time steps.
+                    progress.set_postfix(inner_loop=f"update {self.hydrodynamics}")
                     for ts in range(
                         0, len(period)
                     ):  # if time_step is input in s! #call hydromorphodynamics every time step and store values to get min
                         # if-statement that encompasses all for which the hydrodynamic should be used
                         ## TODO what is the unit of the time_step?
-                        progress.set_postfix(inner_loop=f"update {self.hydrodynamics}")
                         (
                             cur_tau,
                             cur_vel,
@@ -258,9 +256,8 @@ class _VegetationSimulation(BaseSimulation, ABC):
                         )
 
                         # # environment
-                        progress.set_postfix(inner_loop="hydromorpho environment")
                         # hydromorpho environment
-                        hydro_mor = Hydro_Morphodynamics(
+                        hydro_mor.update(
                             tau_cur=cur_tau,
                             u_cur=cur_vel,
                             wl_cur=cur_wl,
@@ -273,9 +270,7 @@ class _VegetationSimulation(BaseSimulation, ABC):
                     # # vegetation dynamics
                     progress.set_postfix(inner_loop="vegetation dynamics")
                     # vegetation mortality and growth update
-                    mort = Veg_Mortality
                     mort.update(
-                        mort,
                         self.biota,
                         self.constants,
                         ets,
@@ -284,19 +279,12 @@ class _VegetationSimulation(BaseSimulation, ABC):
                         period,
                     )
 
-                    colstart = pd.to_datetime(self.constants.ColStart).replace(
-                        year=begin_date.year
-                    )
-                    colend = pd.to_datetime(self.constants.ColEnd).replace(
-                        year=end_date.year
-                    )
                     # # colonization (only in colonization period)
                     # if self.constants.col_days[ets] > 0:
-                    if any(colstart <= pd.to_datetime(period)) and any(
-                        pd.to_datetime(period) <= colend
+                    if self.constants.in_colonization_period(
+                        begin_date, end_date, period
                     ):
                         progress.set_postfix(inner_loop="vegetation colonization")
-                        col = Colonization()
                         col.update(self.biota)
 
                     # update lifestages, initial to juvenile and juvenile to mature
@@ -319,6 +307,8 @@ class _VegetationSimulation(BaseSimulation, ABC):
                         pd.DataFrame(period),
                     )
                     hydro_mor.store_hydromorph_values(self.biota)
+                # flush the output of the year's ets at once.
+                self.output.sync()
 
     def finalise(self):
         """Finalise simulation."""
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from datetime import timedelta
+from contextlib import ExitStack
 from pathlib import Path
 from tkinter.tix import Tree
 from typing import List, Optional, Union
@@ -185,13 +185,10 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
             biota_wrapper.biota.initial.initiate_vegetation_characteristics()
             biota_wrapper.biota.juvenile.initiate_vegetation_characteristics()
             biota_wrapper.biota.mature.initiate_vegetation_characteristics()
-            # Initiate output
-            if biota_wrapper.output.defined:
-                biota_wrapper.output.initialize(biota_wrapper.biota)
-            else:
-                print("WARNING: No output defined, so none exported.")
-            # TODO: Is it really needed to re-initialize the output wrapper?
+            # Initiate output (once, it recreates the output files).
             biota_wrapper.output.initialize(biota_wrapper.biota)
+            if not biota_wrapper.output.defined:
+                print("WARNING: No output defined, so none exported.")
 
         for biota_wrapper in self.biota_wrapper_list:
             initiate_biotas(biota_wrapper)
@@ -209,42 +206,48 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
         if duration is None:
             duration = int(self.constants.sim_duration)
         start_date = pd.to_datetime(self.constants.start_date)
-        years = range(
-            int(start_date.year),
-            int(start_date.year + duration),
-        )  # takes the starting year from the start date defined in the Constants class.
+        # (begin) dates of all the ets of the run, each ets lasting the same days,
+        # starting from the start date defined in the Constants class.
+        ets_days = round(365 / self.constants.t_eco_year)
+        ets_dates = pd.date_range(
+            pd.Timestamp(
+                year=start_date.year, month=start_date.month, day=start_date.day
+            ),
+            periods=duration * self.constants.t_eco_year + 1,
+            freq=pd.Timedelta(days=ets_days),
+        )
 
         first_biota: Vegetation = self.biota_wrapper_list[0].biota
         second_biota: Vegetation = self.biota_wrapper_list[1].biota
-        with tqdm(range((int(duration)))) as progress:
+        # the bio processes keep their state on the object between the ets (e.g.
+        # the bed level difference), so create them once for the whole run. Both
+        # species share the same bed level, and so the same mortality object.
+        hydro_mor = Hydro_Morphodynamics()
+        hydro_mor2 = Hydro_Morphodynamics()
+        mort = Veg_Mortality()
+        col = Colonization()
+        # the output files are closed when leaving the run, also when it fails.
+        with ExitStack() as outputs, tqdm(range((int(duration)))) as progress:
+            for biota_wrapper in self.biota_wrapper_list:
+                outputs.enter_context(biota_wrapper.output)
             for i in progress:
-                current_year = years[i]
                 for ets in range(0, self.constants.t_eco_year):
-                    if ets == 0 and i == 0:
-                        begin_date = pd.Timestamp(
-                            year=current_year,
-                            month=start_date.month,
-                            day=start_date.day,
-                        )
-                    else:
-                        begin_date = end_date
-                    end_date = begin_date + timedelta(
-                        days=round(365 / self.constants.t_eco_year)
-                    )
-                    period = [
-                        begin_date + timedelta(n)
-                        for n in range(int((end_date - begin_date).days))
-                    ]
+                    begin_date = ets_dates[i * self.constants.t_eco_year + ets]
+                    end_date = ets_dates[i * self.constants.t_eco_year + ets + 1]
+                    # daily dates of the ets
+                    period = pd.date_range(begin_date, periods=ets_days)
 
                     # # set dimensions (i.e. update time-dimension)
-                    RESHAPE().time = len(pd.DataFrame(period))
+                    RESHAPE().time = len(period)
 
+                    # shown once per ets, repainting the progress bar every time
+                    # step would slow down the (short) time steps.
+                    progress.set_postfix(inner_loop=f"update {self.hydrodynamics}")
                     for ts in range(
                         0, len(period)
                     ):  # if time_step is input in s! #call hydromorphodynamics every time step and store values to get min
                         # if-statement that encompasses all for which the hydrodynamic should be used
 
-                        progress.set_postfix(inner_loop=f"update {self.hydrodynamics}")
                         (
                             cur_tau,
                             cur_vel,
@@ -257,9 +260,8 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
                         )
 
                         # # environment
-                        progress.set_postfix(inner_loop="hydromorpho environment")
                         # hydromorpho environment
-                        hydro_mor = Hydro_Morphodynamics(
+                        hydro_mor.update(
                             tau_cur=cur_tau,
                             u_cur=cur_vel,
                             wl_cur=cur_wl,
@@ -268,7 +270,7 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
                             veg=first_biota,
                         )
 
-                        hydro_mor2 = Hydro_Morphodynamics(
+                        hydro_mor2.update(
                             tau_cur=cur_tau,
                             u_cur=cur_vel,
                             wl_cur=cur_wl,
@@ -283,9 +285,7 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
                     # # vegetation dynamics
                     progress.set_postfix(inner_loop="vegetation dynamics")
                     # vegetation mortality and growth update
-                    mort = Veg_Mortality
                     mort.update(
-                        mort,
                         first_biota,
                         first_biota.constants,
                         ets,
@@ -293,9 +293,7 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
                         end_date,
                         period,
                     )
-                    mort2 = Veg_Mortality
-                    mort2.update(
-                        mort,
+                    mort.update(
                         second_biota,
                         second_biota.constants,
                         ets,
@@ -304,19 +302,12 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
                         period,
                     )
 
-                    colstart = pd.to_datetime(self.constants.ColStart).replace(
-                        year=begin_date.year
-                    )
-                    colend = pd.to_datetime(self.constants.ColEnd).replace(
-                        year=end_date.year
-                    )
                     # # colonization (only in colonization period)
                     # if self.constants.col_days[ets] > 0:
-                    if any(colstart <= pd.to_datetime(period)) and any(
-                        pd.to_datetime(period) <= colend
+                    if self.constants.in_colonization_period(
+                        begin_date, end_date, period
                     ):
                         progress.set_postfix(inner_loop="vegetation colonization")
-                        col = Colonization()
                         col.update(first_biota, second_biota)
 
                     # update lifestages, initial to juvenile and juvenile to mature
@@ -348,6 +339,9 @@ class _VegetationSimulation_2species(MultipleBiotaBaseSimulation, ABC):
 
                     hydro_mor.store_hydromorph_values(first_biota)
                     hydro_mor2.store_hydromorph_values(second_biota)
+                # flush the output of the year's ets at once.
+                for biota_wrapper in self.biota_wrapper_list:
+                    biota_wrapper.output.sync()
 
     def finalise(self):
         """Finalise simulation."""
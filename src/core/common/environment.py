@@ -5,9 +5,11 @@ coral_mostoel - environment
 @contributor: Peter M.J. Herman
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Union
+from typing import Dict, Iterable, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -16,6 +18,162 @@ from pydantic import validator
 from src.core.base_model import BaseModel
 
 EnvInputAttr = Union[pd.DataFrame, Path, str]
+# Typed (binary) time-series, read through the Parquet engine pandas finds.
+PARQUET_SUFFIXES = (".parquet", ".parq")
+# Storm categories are small integers (0-5).
+STORM_DTYPE = np.int8
+
+
+def _check_increasing(values: np.ndarray, value_file: Path):
+    """
+    Raises a ValueError when the dates (or years) of a time series repeat or are
+    not in order. Checked on the integer representation of the dates, at once.
+    """
+    if values.dtype.kind == "M":
+        values = values.view("i8")
+    if not (np.diff(values) > 0).all():
+        msg = f"Dates not strictly increasing in time series {value_file}"
+        raise ValueError(msg)
+
+
+def _validate_time_series(
+    time_series: pd.DataFrame, value_file: Path, index_name: str
+) -> pd.DataFrame:
+    """
+    Checks shared by the time-series read from (text or Parquet) files: indexed by
+    their `index_name` ("date" or "year") values, without NaNs and strictly
+    increasing. Dates are given as a `DatetimeIndex`.
+    """
+    if time_series.index.name != index_name:
+        if index_name not in time_series.columns:
+            msg = f"No {index_name} index or column in time series {value_file}"
+            raise ValueError(msg)
+        time_series = time_series.set_index(index_name)
+    # column by column, stopping at the first one with NaNs.
+    if time_series.index.hasnans or any(
+        time_series.iloc[:, i].hasnans for i in range(time_series.shape[1])
+    ):
+        msg = f"NaNs detected in time series {value_file}"
+        raise ValueError(msg)
+    if index_name == "date" and not isinstance(time_series.index, pd.DatetimeIndex):
+        # dates the reader could not parse, let pandas raise the error.
+        time_series.index = pd.to_datetime(time_series.index)
+    _check_increasing(time_series.index.to_numpy(), value_file)
+    return time_series
+
+
+@lru_cache(maxsize=32)
+def _read_time_series(value_file: Path, modified_ns: int) -> pd.DataFrame:
+    """
+    Reads a (tab-separated) time-series file. Memoized on the file and its
+    modification time, so simulations reading the same file only parse it once.
+    """
+    # parse the dates straight into the index while reading the (memory mapped)
+    # UTF-8 file.
+    time_series = pd.read_csv(
+        value_file,
+        sep="\t",
+        index_col="date",
+        parse_dates=["date"],
+        memory_map=True,
+        encoding="utf-8",
+    )
+    return _validate_time_series(time_series, value_file, "date")
+
+
+def _read_time_series_chunked(value_file: Path, chunksize: int) -> pd.DataFrame:
+    """
+    Reads a (tab-separated) time-series file in chunks of rows, filling arrays
+    allocated once for the whole file, to bound the memory needed while reading.
+    """
+    # upper bound of the number of rows, from the line ends in the file.
+    n_rows = 0
+    with value_file.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            n_rows += block.count(b"\n")
+
+    columns = None
+    dates = np.empty(n_rows + 1, dtype="datetime64[ns]")
+    values = None
+    stop = 0
+    with pd.read_csv(
+        value_file,
+        sep="\t",
+        index_col="date",
+        parse_dates=["date"],
+        memory_map=True,
+        encoding="utf-8",
+        chunksize=chunksize,
+    ) as reader:
+        for chunk in reader:
+            if chunk.index.hasnans or chunk.isna().to_numpy().any():
+                msg = f"NaNs detected in time series {value_file}"
+                raise ValueError(msg)
+            if values is None:
+                columns = chunk.columns
+                values = np.empty((n_rows + 1, len(columns)))
+            start, stop = stop, stop + len(chunk)
+            dates[start:stop] = pd.to_datetime(chunk.index).to_numpy()
+            values[start:stop] = chunk.to_numpy()
+    if values is None:
+        # no rows, let pandas read the header.
+        return _read_time_series(value_file, value_file.stat().st_mtime_ns).copy()
+    _check_increasing(dates[:stop], value_file)
+    return pd.DataFrame(
+        values[:stop],
+        index=pd.DatetimeIndex(dates[:stop], name="date"),
+        columns=columns,
+        copy=False,
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_cached_date_range(
+    start_date: Union[str, datetime], end_date: Union[str, datetime]
+) -> pd.DatetimeIndex:
+    return pd.date_range(start_date, end_date, freq="D")
+
+
+def _get_date_range(
+    start_date: Union[str, datetime], end_date: Union[str, datetime]
+) -> pd.DatetimeIndex:
+    """
+    Daily dates between the given dates. The range is memoized, each caller gets
+    a shallow copy (sharing the dates) so setting its `name` or `freq` does not
+    change the cached one.
+    """
+    return _get_cached_date_range(start_date, end_date).copy()
+
+
+def _align_to_dates(
+    time_series: Union[pd.DataFrame, pd.Series], dates: Iterable[datetime]
+) -> np.ndarray:
+    """
+    Aligns a (dated) time-series to the given dates, each date takes the last
+    observation on or before it (forward-fill).
+
+    Args:
+        time_series (Union[pd.DataFrame, pd.Series]): Values (first column) indexed
+            by their dates.
+        dates (Iterable[datetime]): Dates to align the values to.
+
+    Raises:
+        ValueError: When the dates start before the first observation.
+
+    Returns:
+        np.ndarray: Value per date.
+    """
+    if isinstance(time_series, pd.DataFrame):
+        time_series = time_series.iloc[:, 0]
+    time_series = time_series.sort_index()
+    src_dates = pd.DatetimeIndex(time_series.index).to_numpy()
+    dst_dates = pd.DatetimeIndex(dates).to_numpy()
+    # binary search of the last observation for every date at once.
+    positions = np.searchsorted(src_dates, dst_dates, side="right") - 1
+    if positions.size and positions[0] < 0:
+        msg = f"Time series starts ({src_dates[0]}) after the first date ({dst_dates[0]})."
+        raise ValueError(msg)
+    return time_series.to_numpy()[positions]
 
 
 class Environment(BaseModel):
@@ -46,13 +204,8 @@ class Environment(BaseModel):
 
         def read_index(value_file: Path) -> pd.DataFrame:
             """Function applicable to time-series in Pandas."""
-            time_series = pd.read_csv(value_file, sep="\t")
-            if time_series.isnull().values.any():
-                msg = f"NaNs detected in time series {value_file}"
-                raise ValueError(msg)
-            time_series["date"] = pd.to_datetime(time_series["date"])
-            time_series.set_index("date", inplace=True)
-            return time_series
+            # a copy, so the memoized time-series cannot be modified.
+            return _read_time_series(value_file, value_file.stat().st_mtime_ns).copy()
 
         if isinstance(value, pd.DataFrame):
             return value
@@ -61,6 +214,8 @@ class Environment(BaseModel):
         if isinstance(value, Path):
             if not value.is_file():
                 raise FileNotFoundError(value)
+            if value.suffix.lower() in PARQUET_SUFFIXES:
+                return _validate_time_series(pd.read_parquet(value), value, "date")
             return read_index(value)
         raise NotImplementedError(f"Validator not available for type {type(value)}")
 
@@ -88,8 +243,19 @@ class Environment(BaseModel):
         if isinstance(value, Path):
             if not value.is_file():
                 raise FileNotFoundError(value)
-            csv_values = pd.read_csv(value, sep="\t")
-            csv_values.set_index("year", inplace=True)
+            if value.suffix.lower() in PARQUET_SUFFIXES:
+                csv_values = pd.read_parquet(value)
+            else:
+                csv_values = pd.read_csv(
+                    value,
+                    sep="\t",
+                    index_col="year",
+                    memory_map=True,
+                    encoding="utf-8",
+                )
+            csv_values = _validate_time_series(csv_values, value, "year")
+            if "stormcat" in csv_values.columns:
+                csv_values = csv_values.astype({"stormcat": STORM_DTYPE})
             return csv_values
         raise NotImplementedError(f"Validator not available for type {type(value)}")
 
@@ -144,12 +310,88 @@ class Environment(BaseModel):
 
         return None
 
+    @classmethod
+    def from_validated(cls, **fields) -> "Environment":
+        """
+        Creates an `Environment` from already validated values (e.g. the time-series
+        of another `Environment`) without running the validators again.
+
+        Returns:
+            Environment: Environment with the given values.
+        """
+        if "dates" not in fields:
+            fields["dates"] = cls.prevalidate_dates(cls.__fields__["dates"].default)
+        return cls.construct(**fields)
+
+    @classmethod
+    def from_files(cls, max_workers: int = 4, **fields: EnvInputAttr) -> "Environment":
+        """
+        Creates an `Environment` reading its time-series files at the same time (in
+        a pool of threads), as each file is read and parsed independently. Other
+        values are validated as usual.
+
+        Args:
+            max_workers (int, optional): Files read at the same time. Defaults to 4.
+
+        Returns:
+            Environment: Environment with the given values.
+        """
+        validators = dict(
+            light=cls.validate_dataframe_or_path,
+            light_attenuation=cls.validate_dataframe_or_path,
+            temperature=cls.validate_dataframe_or_path,
+            aragonite=cls.validate_dataframe_or_path,
+            storm_category=cls.validate_storm_category,
+        )
+        files = {
+            parameter: value
+            for parameter, value in fields.items()
+            if parameter in validators and isinstance(value, (str, Path))
+        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                parameter: executor.submit(validators[parameter], value)
+                for parameter, value in files.items()
+            }
+            # the errors of the readers are raised here, as when validating.
+            fields.update(
+                {parameter: future.result() for parameter, future in futures.items()}
+            )
+        return cls(**fields)
+
+    @classmethod
+    def load_chunked(
+        cls, chunksize: int = 10_000, **fields: EnvInputAttr
+    ) -> "Environment":
+        """
+        Creates an `Environment` reading its daily time-series files in chunks of
+        rows, which bounds the memory needed to read very long time-series. Other
+        values are validated as usual.
+
+        Args:
+            chunksize (int, optional): Rows read at once. Defaults to 10_000.
+
+        Returns:
+            Environment: Environment with the given values.
+        """
+        daily_params = ("light", "light_attenuation", "temperature", "aragonite")
+        for parameter in daily_params:
+            value = fields.get(parameter, None)
+            if isinstance(value, str):
+                value = Path(value)
+            if (
+                isinstance(value, Path)
+                and value.is_file()
+                and value.suffix.lower() not in PARQUET_SUFFIXES
+            ):
+                fields[parameter] = _read_time_series_chunked(value, chunksize)
+        return cls(**fields)
+
     @staticmethod
     def get_dates_dataframe(
         start_date: Union[str, datetime], end_date: Union[str, datetime]
     ) -> pd.DataFrame:
-        dates = pd.date_range(start_date, end_date, freq="D")
-        return pd.DataFrame({"date": dates})
+        return pd.DataFrame({"date": _get_date_range(start_date, end_date)})
 
     def get_dates(self) -> Iterable[datetime]:
         """
@@ -178,6 +420,34 @@ class Environment(BaseModel):
 
         self.dates = self.get_dates_dataframe(start_date, end_date)
 
+    def cache_as_parquet(self, out_dir: Path) -> Dict[str, Path]:
+        """
+        Writes the loaded time-series to Parquet files, which can be given instead
+        of the tab-separated files so a next simulation does not parse them again.
+        Requires a Parquet engine (pyarrow or fastparquet) to be installed.
+
+        Args:
+            out_dir (Path): Directory to write the Parquet files to.
+
+        Returns:
+            Dict[str, Path]: Written Parquet file per time-series parameter.
+        """
+        out_dir.mkdir(parents=True, exist_ok=True)
+        parquet_files = dict()
+        for parameter in (
+            "light",
+            "light_attenuation",
+            "temperature",
+            "aragonite",
+            "storm_category",
+        ):
+            time_series: Optional[pd.DataFrame] = getattr(self, parameter)
+            if time_series is None:
+                continue
+            parquet_files[parameter] = out_dir / f"{parameter}.parquet"
+            time_series.to_parquet(parquet_files[parameter])
+        return parquet_files
+
     @property
     def temp_kelvin(self) -> pd.DataFrame:
         """
@@ -210,8 +480,10 @@ class Environment(BaseModel):
         Returns:
             pd.DataFrame: value as a pandas DataFrame.
         """
-        monthly_mean = self.temp_kelvin.groupby(
-            [self.temp_kelvin.index.year, self.temp_kelvin.index.month]
+        # convert the temperature only once, instead of for every use.
+        temp_kelvin = self.temp_kelvin
+        monthly_mean = temp_kelvin.groupby(
+            [temp_kelvin.index.year, temp_kelvin.index.month]
         ).agg(["mean"])
         monthly_maximum_mean = monthly_mean.groupby(level=0).agg(["min", "max"])
         monthly_maximum_mean.columns = monthly_maximum_mean.columns.droplevel([0, 1])
@@ -225,7 +497,8 @@ class Environment(BaseModel):
         """
         Set the time-series data to a time-series, or a  value. In case :param value: is not iterable, the
         :param parameter: is assumed to be constant over time. In case :param value: is iterable, make sure its length
-        complies with the simulation length.
+        complies with the simulation length. In case :param value: is a dated time-series (pd.DataFrame or
+        pd.Series), its last value on or before each simulation date is used.
 
         Included parameters:
             light                       :   incoming light-intensity [umol photons m-2 s-1]
@@ -240,19 +513,6 @@ class Environment(BaseModel):
             pre_date (Optional[int], optional): Time-series start before simulation dates [yrs]. Defaults to None.
         """
 
-        def set_value(val):
-            """Function to set  value."""
-            simple_dates = self.get_dates()
-            if pre_date is None:
-                return pd.DataFrame({parameter: val}, index=simple_dates)
-
-            dates = pd.date_range(
-                simple_dates.iloc[0] - pd.DateOffset(years=pre_date),
-                simple_dates.iloc[-1],
-                freq="D",
-            )
-            return pd.DataFrame({parameter: val}, index=dates)
-
         if self.dates is None:
             msg = (
                 f"No dates are defined. "
@@ -261,15 +521,53 @@ class Environment(BaseModel):
             )
             raise TypeError(msg)
 
-        if parameter == "LAC":
-            parameter = "light_attenuation"
-
-        daily_params = ("light", "light_attenuation", "temperature", "aragonite")
-        if parameter in daily_params:
-            setattr(self, parameter, set_value(value))
-        elif parameter == "storm":
-            years = set(self.get_dates().dt.year)
-            self.storm_category = pd.DataFrame(data=value, index=years)
-        else:
+        parameter = self._PARAMETER_ALIASES.get(parameter, parameter)
+        set_values = self._PARAMETER_SETTERS.get(parameter, None)
+        if set_values is None:
             msg = f"Entered parameter ({parameter}) not included. See documentation."
             raise ValueError(msg)
+        set_values(self, parameter, value, pre_date)
+
+    def _set_daily_values(
+        self, parameter: str, value: EnvironmentValue, pre_date: Optional[int]
+    ):
+        """Sets the daily time-series of a parameter, see `set_parameter_values`."""
+        simple_dates = self.get_dates()
+        if pre_date is None:
+            dates = simple_dates
+        else:
+            dates = _get_date_range(
+                simple_dates.iloc[0] - pd.DateOffset(years=pre_date),
+                simple_dates.iloc[-1],
+            )
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            # a time-series with its own dates.
+            value = _align_to_dates(value, dates)
+        else:
+            # an own (typed) copy, so the frame does not need to copy it again.
+            value = np.array(value, dtype=float)
+        if value.ndim == 0:
+            value = np.full(len(dates), value)
+        time_series = pd.DataFrame({parameter: value}, index=dates, copy=False)
+        setattr(self, parameter, time_series)
+
+    def _set_storm_values(
+        self, parameter: str, value: EnvironmentValue, pre_date: Optional[int]
+    ):
+        """Sets the annual storm categories, see `set_parameter_values`."""
+        # (sorted) simulation years from a datetime64 truncation.
+        dates = self.get_dates().to_numpy()
+        years = np.unique(dates.astype("datetime64[Y]").astype(int) + 1970)
+        self.storm_category = pd.DataFrame(
+            data=np.asarray(value, dtype=STORM_DTYPE), index=years
+        )
+
+    # Parameters accepted by `set_parameter_values`, and the setter of each of them.
+    _PARAMETER_ALIASES = dict(LAC="light_attenuation")
+    _PARAMETER_SETTERS = dict(
+        light=_set_daily_values,
+        light_attenuation=_set_daily_values,
+        temperature=_set_daily_values,
+        aragonite=_set_daily_values,
+        storm=_set_storm_values,
+    )
@@ -10,7 +10,7 @@ veg_model - utils
 from typing import Optional, Tuple, Union
 
 import numpy as np
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 
 from src.biota_models.coral.model.coral_only import CoralOnly
 from src.biota_models.vegetation.model.veg_only import VegOnly
@@ -274,4 +274,11 @@ def time_series_year(time_series: DataFrame, year: int):
     :type time_series: pandas.DataFrame
     :type year: int
     """
-    return time_series[time_series.index.year == year].values.transpose()[0]
+    index = time_series.index
+    if index.is_monotonic_increasing:
+        # the year is a contiguous block of a sorted index, slice it directly
+        start, end = index.searchsorted(
+            [Timestamp(year, 1, 1), Timestamp(year + 1, 1, 1)]
+        )
+        return time_series.iloc[start:end, 0].to_numpy().copy()
+    return time_series.to_numpy()[index.year == year, 0]
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 
 from src.core.hydrodynamics.delft3d import DimrModel, FlowFmModel
@@ -23,9 +24,11 @@ class HydrodynamicsFactory:
     ]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_hydrodynamic_model_type(model_name: str) -> HydrodynamicProtocol:
         """
-        Returns the type associated with the given model name.
+        Returns the type associated with the given model name. The type is only
+        looked up once per model name.
 
         Args:
             model_name (str): Model name to retrieve.
@@ -139,8 +139,10 @@ class Reef1D(BaseModel):
 
     @property
     def wave_number(self):
-        k = np.zeros(len(self.wave_length))
-        k[self.wave_length > 0] = 2 * np.pi / self.wave_length[self.wave_length > 0]
+        # solve the dispersion relation once; dry cells keep a zero wave number
+        wave_length = self.wave_length
+        k = np.zeros(len(wave_length))
+        np.divide(2 * np.pi, wave_length, out=k, where=wave_length > 0)
         return k
 
     @property
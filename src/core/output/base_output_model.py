@@ -1,6 +1,11 @@
 from abc import ABC
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+from netCDF4 import Dataset
+from pydantic import PrivateAttr
 
 from src.core.base_model import BaseModel
 from src.core.biota.biota_model import Biota
@@ -14,7 +19,8 @@ class BaseOutputParameters(BaseModel, ABC):
         Returns:
             bool: When all the values are 'filled'.
         """
-        return any(self.dict().values())
+        # only the (flag) fields, without copying the model into a dict.
+        return any(getattr(self, field) for field in self.__fields__)
 
 
 class BaseOutput(BaseModel, ABC):
@@ -28,6 +34,9 @@ class BaseOutput(BaseModel, ABC):
     # Output model attributes.
     output_params: BaseOutputParameters = BaseOutputParameters()
 
+    # Output netcdf dataset kept open between updates.
+    _dataset: Optional[Dataset] = PrivateAttr(default=None)
+
     def valid_output(self) -> bool:
         """
         Verifies whether this model can generate valid output.
@@ -47,6 +56,63 @@ class BaseOutput(BaseModel, ABC):
         """
         return self.output_dir / self.output_filename
 
+    @staticmethod
+    def get_chunksizes(n_space: int, n_time: int = 1) -> Tuple[int, int]:
+        """
+        Gets the chunk sizes of a (time, space) variable written `n_time` time steps
+        at once, so each write fills whole chunks while a chunk (of doubles) has at
+        least 64 KB.
+
+        Args:
+            n_space (int): Size of the space dimension.
+            n_time (int, optional): Time steps written at once. Defaults to 1.
+
+        Returns:
+            Tuple[int, int]: Chunk sizes of the time and space dimensions.
+        """
+        n_space = max(n_space, 1)
+        n_time = max(n_time, 1)
+        n_writes = -(-(64 * 1024 // 8) // (n_time * n_space))
+        return n_time * n_writes, n_space
+
+    @classmethod
+    def get_variable_settings(cls, n_space: int, n_time: int = 1) -> dict:
+        """
+        Gets the storage settings of a (time, space) variable written `n_time` time
+        steps at once: chunked along its writes (see `get_chunksizes`) and
+        compressed (lossless) with byte-shuffling and zlib.
+
+        Args:
+            n_space (int): Size of the space dimension.
+            n_time (int, optional): Time steps written at once. Defaults to 1.
+
+        Returns:
+            dict: Keyword arguments for `Dataset.createVariable`.
+        """
+        return dict(
+            chunksizes=cls.get_chunksizes(n_space, n_time),
+            zlib=True,
+            complevel=4,
+            shuffle=True,
+        )
+
+    @staticmethod
+    def get_time_index(time_indices: np.ndarray) -> Union[slice, np.ndarray]:
+        """
+        Gets the index to write the given time steps with. Consecutive time steps (the
+        common case) are written as one contiguous slice instead of element by element.
+
+        Args:
+            time_indices (np.ndarray): Indices of the time steps to write.
+
+        Returns:
+            Union[slice, np.ndarray]: Slice of the time steps when consecutive,
+                otherwise the given indices.
+        """
+        if len(time_indices) > 0 and (np.diff(time_indices) == 1).all():
+            return slice(int(time_indices[0]), int(time_indices[-1]) + 1)
+        return time_indices
+
     def initialize(self, biota: Optional[Biota]):
         """
         Method to initialize the Output Model based on a given biota model.
@@ -56,3 +122,43 @@ class BaseOutput(BaseModel, ABC):
             biota (Optional[Biota]): Base model for the generated output.
         """
         pass
+
+    @contextmanager
+    def append_dataset(self) -> Iterator[Dataset]:
+        """
+        Gets the output netcdf dataset opened to append data. The dataset is kept
+        open between updates until it gets closed, its writes are only flushed to
+        disk on `sync` (or `close`). Use the output model as a context manager
+        (`with output: ...`) to close it even when an update fails. Its values
+        are written (and read) without masking or scaling.
+
+        Yields:
+            Iterator[Dataset]: Output netcdf dataset.
+        """
+        if self._dataset is None or not self._dataset.isopen():
+            self._dataset = Dataset(self.output_filepath, mode="a")
+            # the updates write plain arrays, skip the masking and scaling checks.
+            self._dataset.set_auto_maskandscale(False)
+        yield self._dataset
+
+    def sync(self):
+        """
+        Flushes the data written to the output netcdf dataset to disk, if it is
+        kept open.
+        """
+        if self._dataset is not None and self._dataset.isopen():
+            self._dataset.sync()
+
+    def close(self):
+        """
+        Closes the output netcdf dataset, if it was kept open.
+        """
+        if self._dataset is not None and self._dataset.isopen():
+            self._dataset.close()
+        self._dataset = None
+
+    def __enter__(self) -> "BaseOutput":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
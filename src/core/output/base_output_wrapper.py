@@ -96,19 +96,22 @@ class BaseOutputWrapper(BaseModel):
         Returns:
             Tuple[np.ndarray, np.ndarray]: Resulting tuple of xy_stations, idx_stations
         """
-        nout_his = len(xy_coordinates[outpoint, 0])
-
         x_coord = xy_coordinates[:, 0]
         y_coord = xy_coordinates[:, 1]
 
         x_station = xy_coordinates[outpoint, 0]
         y_station = xy_coordinates[outpoint, 1]
 
-        idx = np.zeros(nout_his)
-
-        for s in range(len(idx)):
-            idx[s] = np.argmin(
-                (x_coord - x_station[s]) ** 2 + (y_coord - y_station[s]) ** 2
+        # nearest grid point of (a block of) stations at once, the blocks bound the
+        # (stations x points) distances held in memory.
+        idx = np.zeros(len(x_station), dtype=int)
+        block = max(1, (1 << 22) // max(len(x_coord), 1))
+        for start in range(0, len(idx), block):
+            stop = start + block
+            idx[start:stop] = np.argmin(
+                (x_coord[None, :] - x_station[start:stop, None]) ** 2
+                + (y_coord[None, :] - y_station[start:stop, None]) ** 2,
+                axis=1,
             )
 
         idx_stations = idx.astype(int)
@@ -127,3 +130,27 @@ class BaseOutputWrapper(BaseModel):
         # Initialize output models.
         self.his_output.initialize(biota)
         self.map_output.initialize(biota)
+
+    def sync(self):
+        """
+        Flushes the output files of all available output models (His and Map) to
+        disk.
+        """
+        for out_model in (self.map_output, self.his_output):
+            if out_model is not None:
+                out_model.sync()
+
+    def close(self):
+        """
+        Closes the output files of all available output models (His and Map).
+        """
+        for out_model in (self.map_output, self.his_output):
+            if out_model is not None:
+                out_model.close()
+
+    def __enter__(self) -> "BaseOutputWrapper":
+        return self
+
+    def __exit__(self, *exc_info):
+        # closed as well when the run fails, keeping the written years readable.
+        self.close()
@@ -74,3 +74,21 @@ class OutputProtocol(Protocol):
             NotImplementedError: When the model does not implement its own definition.
         """
         raise NotImplementedError
+
+    def sync(self):
+        """
+        Flushes the data written since the previous sync to the output file.
+
+        Raises:
+            NotImplementedError: When the model does not implement its own definition.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Closes the output file, if it was kept open between updates.
+
+        Raises:
+            NotImplementedError: When the model does not implement its own definition.
+        """
+        raise NotImplementedError
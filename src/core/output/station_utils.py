@@ -0,0 +1,129 @@
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Type
+
+import numpy as np
+
+from src.core.output.base_output_wrapper import BaseOutputWrapper
+
+# station lookups (small arrays), keyed on a digest of the grid and output points.
+_xy_stations_cache: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+_xy_stations_cache_size = 16
+
+
+def _get_digest(array: np.ndarray) -> bytes:
+    # hashes the (contiguous) array memory through a byte view, without a copy.
+    return hashlib.blake2b(array.reshape(-1).view(np.uint8), digest_size=16).digest()
+
+
+def get_xy_stations(
+    xy_coordinates: np.ndarray, outpoint: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memoized `BaseOutputWrapper.get_xy_stations`, so configuring the output again
+    for the same grid and output points does not repeat the station lookup. Only a
+    digest of the grid is kept, not the grid itself.
+
+    Args:
+        xy_coordinates (np.ndarray): Input xy-coordinates system.
+        outpoint (np.ndarray): Boolean per x-y indicating if his output is desired.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Resulting tuple of xy_stations, idx_stations
+    """
+    xy_coordinates = np.ascontiguousarray(xy_coordinates)
+    outpoint = np.ascontiguousarray(outpoint, dtype=bool)
+    key = (
+        _get_digest(xy_coordinates),
+        xy_coordinates.shape,
+        xy_coordinates.dtype.str,
+        _get_digest(outpoint),
+        outpoint.shape,
+    )
+    xy_stations = _xy_stations_cache.pop(key, None)
+    if xy_stations is None:
+        xy_stations = BaseOutputWrapper.get_xy_stations(xy_coordinates, outpoint)
+        if len(_xy_stations_cache) >= _xy_stations_cache_size:
+            # drop the least recently used lookup.
+            _xy_stations_cache.pop(next(iter(_xy_stations_cache)))
+    # (re)inserted as the most recently used lookup.
+    _xy_stations_cache[key] = xy_stations
+    return xy_stations[0].copy(), xy_stations[1].copy()
+
+
+def configure_output_wrapper(
+    output: Optional[BaseOutputWrapper],
+    output_wrapper_type: Type[BaseOutputWrapper],
+    first_date: datetime,
+    xy_coordinates: np.ndarray,
+    get_outpoint: Callable[[], np.ndarray],
+    output_dir: Path,
+) -> BaseOutputWrapper:
+    """
+    Creates an output wrapper (with its map and his output) when none is given,
+    otherwise sets the values of the given one that are still undefined. The output
+    definitions (and so the station lookup) are only built when needed.
+
+    Args:
+        output (Optional[BaseOutputWrapper]): Current output wrapper, if any.
+        output_wrapper_type (Type[BaseOutputWrapper]): Output wrapper to create.
+        first_date (datetime): First date of the simulation (e.g. a `pd.Timestamp`).
+        xy_coordinates (np.ndarray): (x,y)-coordinates of the hydrodynamic model.
+        get_outpoint (Callable[[], np.ndarray]): Gets a boolean per (x,y) point
+            indicating if his output is desired.
+        output_dir (Path): Directory to write the output to.
+
+    Returns:
+        BaseOutputWrapper: Configured output wrapper.
+    """
+
+    @lru_cache(maxsize=None)
+    def get_output_wrapper_dict() -> dict:
+        return dict(
+            first_date=first_date,
+            xy_coordinates=xy_coordinates,
+            outpoint=get_outpoint(),
+            output_dir=output_dir,
+        )
+
+    def get_map_output_dict() -> dict:
+        return dict(
+            output_dir=output_dir,
+            first_year=first_date.year,
+            xy_coordinates=xy_coordinates,
+        )
+
+    def get_his_output_dict() -> dict:
+        xy_stations, idx_stations = get_xy_stations(
+            xy_coordinates, get_output_wrapper_dict()["outpoint"]
+        )
+        return dict(
+            output_dir=output_dir,
+            first_date=first_date,
+            xy_stations=xy_stations,
+            idx_stations=idx_stations,
+        )
+
+    if output is None:
+        return output_wrapper_type(
+            **get_output_wrapper_dict(),
+            map_output=get_map_output_dict(),
+            his_output=get_his_output_dict(),
+        )
+
+    def update_output(out_model, get_new_values: Callable[[], dict]):
+        if out_model is None:
+            return None
+        # inspect the attributes directly, `dict()` would copy the whole model.
+        if all(getattr(out_model, k) is not None for k in out_model.__fields__):
+            return None
+        for k, v in get_new_values().items():
+            if getattr(out_model, k, None) is None:
+                setattr(out_model, k, v)
+
+    update_output(output, get_output_wrapper_dict)
+    update_output(output.map_output, get_map_output_dict)
+    update_output(output.his_output, get_his_output_dict)
+    return output
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import get_context
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Type, Union
 
 from pydantic import validator
 
@@ -84,15 +87,14 @@ class BaseSimulation(BaseModel, ABC):
         Generates the required directories if they do not exist already.
         """
         loop_dirs: List[Path] = [
-            "working_dir",
-            "output_dir",
-            "input_dir",
-            "figures_dir",
+            self.working_dir,
+            self.output_dir,
+            self.input_dir,
+            self.figures_dir,
         ]
-        for loop_dir in loop_dirs:
-            value_dir: Path = getattr(self, loop_dir)
-            if not value_dir.is_dir():
-                value_dir.mkdir(parents=True)
+        for value_dir in loop_dirs:
+            # an existing directory is kept, without checking for it first.
+            value_dir.mkdir(parents=True, exist_ok=True)
 
     def validate_environment(self):
         """Check input; if all required data is provided."""
@@ -135,6 +137,66 @@ class BaseSimulation(BaseModel, ABC):
         """Finalise simulation."""
         pass
 
+    @classmethod
+    def run_sweep(
+        cls,
+        base_config: dict,
+        overrides: List[dict],
+        duration: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[Path]]:
+        """
+        Runs (initiates, runs and finalises) one simulation of this type per given
+        override of the base configuration, each in its own (spawned) process. As
+        every process builds its own simulation, they share no model state (e.g.
+        `RESHAPE`). Each simulation needs its own `working_dir`, where its
+        hydrodynamic model runs and (by default) its output is written. When the
+        sweep is run from a script, it has to be called from within its
+        `if __name__ == "__main__":` block.
+
+        Args:
+            base_config (dict): Values shared by all the simulations of the sweep.
+            overrides (List[dict]): Values of each simulation replacing the base ones.
+            duration (Optional[int], optional): Simulation duration [yrs]. Defaults to None.
+            max_workers (Optional[int], optional): Maximum number of processes. Defaults to None.
+
+        Raises:
+            ValueError: When the simulations do not have their own working directory.
+
+        Returns:
+            List[Optional[Path]]: Directory the output of each simulation was written
+                to (None without output), in the order of `overrides`.
+        """
+        configs = [dict(base_config, **override) for override in overrides]
+        # without a working_dir, the simulation runs in the default one.
+        working_dirs = set(
+            Path(
+                config.get("working_dir") or cls.__fields__["working_dir"].default
+            ).resolve()
+            for config in configs
+        )
+        if len(working_dirs) != len(configs):
+            raise ValueError("Each simulation of the sweep needs its own working_dir.")
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=get_context("spawn")
+        ) as executor:
+            return list(
+                executor.map(_run_simulation, repeat(cls), configs, repeat(duration))
+            )
+
+
+def _run_simulation(
+    simulation_type: Type[BaseSimulation], config: dict, duration: Optional[int]
+) -> Optional[Path]:
+    # runs in a process of `BaseSimulation.run_sweep`.
+    simulation = simulation_type(**config)
+    simulation.initiate()
+    simulation.run(duration)
+    simulation.finalise()
+    if simulation.output is None:
+        return None
+    return simulation.output.output_dir
+
 
 class Simulation(BaseSimulation):
     """
@@ -83,15 +83,14 @@ class MultipleBiotaBaseSimulation(BaseModel, ABC):
         Generates the required directories if they do not exist already.
         """
         loop_dirs: List[Path] = [
-            "working_dir",
-            "output_dir",
-            "input_dir",
-            "figures_dir",
+            self.working_dir,
+            self.output_dir,
+            self.input_dir,
+            self.figures_dir,
         ]
-        for loop_dir in loop_dirs:
-            value_dir: Path = getattr(self, loop_dir)
-            if not value_dir.is_dir():
-                value_dir.mkdir(parents=True)
+        for value_dir in loop_dirs:
+            # an existing directory is kept, without checking for it first.
+            value_dir.mkdir(parents=True, exist_ok=True)
 
     def validate_environment(self):
         """Check input; if all required data is provided."""
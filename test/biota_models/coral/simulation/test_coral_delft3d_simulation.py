@@ -13,6 +13,7 @@ from src.biota_models.coral.simulation.coral_delft3d_simulation import (
     _CoralDelft3DSimulation,
 )
 from src.core.hydrodynamics.hydrodynamic_protocol import HydrodynamicProtocol
+from src.core.output import station_utils
 from src.core.simulation.base_simulation import BaseSimulation
 
 
@@ -95,6 +96,21 @@ class TestCoralDelft3dSimulation:
         assert test_sim.output.map_output is not None
         assert test_sim.output.his_output is not None
 
+    def test_configure_output_when_configured_skips_stations_lookup(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        test_sim = self.DummySim(hydrodynamics=self.DummyHydro())
+        test_sim.configure_output()
+        idx_stations = test_sim.output.his_output.idx_stations
+
+        def fail_lookup(*args, **kwargs):
+            raise AssertionError("Stations should not be looked up again.")
+
+        monkeypatch.setattr(station_utils, "get_xy_stations", fail_lookup)
+        test_sim.configure_output()
+
+        assert test_sim.output.his_output.idx_stations is idx_stations
+
     constants_file_case: Path = (
         TestUtils.get_local_test_data_dir("transect_case") / "input" / "coral_input.txt"
     )
@@ -2,8 +2,11 @@ from pathlib import Path
 from test.utils import TestUtils
 from typing import Union
 
+import numpy as np
 import pytest
+from netCDF4 import Dataset
 
+from src.biota_models.coral.bio_process.recruitment import Recruitment
 from src.biota_models.coral.model.coral_constants import CoralConstants
 from src.biota_models.coral.simulation.coral_transect_simulation import (
     CoralTransectSimulation,
@@ -16,3 +19,50 @@ class TestCoralTransectSimulation:
         test_sim = CoralTransectSimulation()
         assert issubclass(type(test_sim), BaseSimulation)
         assert test_sim.mode == "Transect"
+
+    def test_failing_run_closes_output_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        input_dir = TestUtils.get_local_test_data_dir("transect_case") / "input"
+        test_sim = CoralTransectSimulation(
+            working_dir=tmp_path,
+            constants=input_dir / "coral_input.txt",
+            environment=dict(
+                light=input_dir / "TS_PAR.txt",
+                temperature=input_dir / "TS_SST.txt",
+                storm=input_dir / "TS_stormcat2.txt",
+                dates=("2000-01-01", "2100-01-01"),
+            ),
+            hydrodynamics=dict(
+                definition_file=input_dir / "TS_waves.txt",
+                config_file=input_dir / "config.csv",
+            ),
+            output=dict(
+                output_dir=tmp_path / "output",
+                map_output=dict(output_params=dict(fme=False)),
+                his_output=dict(output_params=dict(fme=False)),
+            ),
+            biota=dict(dc=0.125, hc=0.125, bc=0.1, tc=0.1, ac=0.2, Csp=0.6),
+        )
+        test_sim.initiate()
+
+        # the recruitment of the second year fails, after the first year's output.
+        n_updates = 0
+
+        def failing_update(*args):
+            nonlocal n_updates
+            n_updates += 1
+            if n_updates > 1:
+                raise RuntimeError("Failing recruitment")
+
+        monkeypatch.setattr(Recruitment, "update", failing_update)
+        with pytest.raises(RuntimeError):
+            test_sim.run(duration=3)
+
+        # the first year is kept, once per year in the map and per day in the his.
+        output = test_sim.output
+        for out_model, n_written in ((output.map_output, 1), (output.his_output, 366)):
+            assert out_model._dataset is None
+            with Dataset(out_model.output_filepath) as nc_data:
+                assert nc_data["time"].size == n_written
+                assert np.isfinite(nc_data["dc"][:]).all()
@@ -0,0 +1,37 @@
+import numpy as np
+
+from src.biota_models.vegetation.bio_process.veg_colonisation import Colonization
+from src.biota_models.vegetation.model.veg_model import Vegetation
+from src.core import RESHAPE
+
+
+class TestColonization:
+    def test_cir_formula(self):
+        max_wl = np.array([0.0, 0.5, 0.5, 1.2])
+        min_wl = np.array([0.0, 0.0, 0.3, 0.0])
+        cir = Colonization.cir_formula(max_wl, min_wl)
+        assert cir.tolist() == [False, True, False, True]
+
+    def test_cir_formula_does_not_modify_water_levels(self):
+        max_wl = np.array([0.0, 0.5, 0.5, 1.2])
+        min_wl = np.array([0.0, 0.0, 0.3, 0.0])
+        Colonization.cir_formula(max_wl, min_wl)
+        assert max_wl.tolist() == [0.0, 0.5, 0.5, 1.2]
+        assert min_wl.tolist() == [0.0, 0.0, 0.3, 0.0]
+
+    def test_update_without_colonisation_area_leaves_vegetation_unchanged(self):
+        RESHAPE().space = 3
+        veg = Vegetation(species="Spartina")
+        veg.initial.initiate_vegetation_characteristics()
+        veg.juvenile.initiate_vegetation_characteristics()
+        veg.mature.initiate_vegetation_characteristics()
+        # flooded at both the maximum and minimum water level, or never flooded
+        veg.max_wl = np.array([0.0, 0.5, 1.2])
+        veg.min_wl = np.array([0.0, 0.3, 0.1])
+        initial_frac = veg.initial.veg_frac.copy()
+
+        col = Colonization()
+        col.update(veg)
+
+        assert col.seed_loc.size == 0
+        assert np.array_equal(veg.initial.veg_frac, initial_frac)
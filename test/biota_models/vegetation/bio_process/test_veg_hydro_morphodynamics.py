@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from src.biota_models.vegetation.bio_process.veg_hydro_morphodynamics import (
+    Hydro_Morphodynamics,
+)
+from src.biota_models.vegetation.model.veg_model import Vegetation
+from src.core import RESHAPE
+
+
+class TestHydroMorphodynamics:
+    @staticmethod
+    def update_time_steps(
+        hydro_mor: Hydro_Morphodynamics, veg: Vegetation, wl_values: list
+    ):
+        for ts, wl in enumerate(wl_values):
+            wl_cur = np.array([wl, wl + 1.0])
+            hydro_mor.update(
+                tau_cur=-wl_cur,
+                u_cur=2 * wl_cur,
+                wl_cur=wl_cur,
+                bl_cur=wl_cur / 10,
+                ts=ts,
+                veg=veg,
+            )
+
+    @pytest.mark.parametrize(
+        "n_ts",
+        [
+            pytest.param(5, id="Fewer time steps than expected"),
+            pytest.param(2, id="More time steps than expected"),
+        ],
+    )
+    def test_get_hydromorph_values_over_stored_time_steps(
+        self, n_ts: int, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(RESHAPE(), "time", n_ts)
+        veg = Vegetation(species="Spartina")
+        hydro_mor = Hydro_Morphodynamics()
+
+        # negative water levels, so a column left at 0 would be the maximum.
+        self.update_time_steps(hydro_mor, veg, [-3.0, -1.0, -2.0])
+        hydro_mor.get_hydromorph_values(veg)
+
+        assert veg.wl_ts.shape == (2, 3)
+        assert veg.max_wl.tolist() == [-1.0, 0.0]
+        assert veg.min_wl.tolist() == [-3.0, -2.0]
+        assert veg.max_tau.tolist() == [3.0, 2.0]
+        assert veg.max_u.tolist() == [-2.0, 0.0]
+        assert np.allclose(veg.bl, [-0.2, -0.1])
+
+    def test_update_new_ets_keeps_previous_water_levels(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(RESHAPE(), "time", 2)
+        veg = Vegetation(species="Spartina")
+        hydro_mor = Hydro_Morphodynamics()
+        self.update_time_steps(hydro_mor, veg, [1.0, 2.0])
+        hydro_mor.get_hydromorph_values(veg)
+        hydro_mor.store_hydromorph_values(veg)
+
+        self.update_time_steps(hydro_mor, veg, [5.0])
+
+        assert veg.wl_prev.tolist() == [[1.0, 2.0], [2.0, 3.0]]
+        assert veg.wl_ts.tolist() == [[5.0], [6.0]]
+
+    def test_init_per_time_step_keeps_ets_values(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(RESHAPE(), "time", 3)
+        veg = Vegetation(species="Spartina")
+        for ts, wl in enumerate([1.0, 3.0, 2.0]):
+            wl_cur = np.array([wl, -wl])
+            hydro_mor = Hydro_Morphodynamics(
+                tau_cur=wl_cur,
+                u_cur=wl_cur,
+                wl_cur=wl_cur,
+                bl_cur=wl_cur,
+                ts=ts,
+                veg=veg,
+            )
+        hydro_mor.get_hydromorph_values(veg)
+
+        assert veg.max_wl.tolist() == [3.0, -1.0]
+        assert veg.min_wl.tolist() == [1.0, -3.0]
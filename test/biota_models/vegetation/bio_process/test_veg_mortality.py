@@ -0,0 +1,16 @@
+import numpy as np
+
+from src.biota_models.vegetation.bio_process.veg_mortality import Veg_Mortality
+
+
+class TestVegMortality:
+    def test_surviving_fraction(self):
+        veg_frac = np.array([[0.5, 0.2], [0.3, 0.0]])
+        flood = np.array([[0.1, 0.1], [0.0, 0.0]])
+        burial = np.array([[0.0, 1.0], [0.1, 0.0]])
+
+        survived = Veg_Mortality.surviving_fraction(veg_frac, flood, burial)
+
+        assert np.allclose(survived, [[0.4, 0.0], [0.2, 0.0]])
+        # the given fractions are not modified.
+        assert veg_frac.tolist() == [[0.5, 0.2], [0.3, 0.0]]
@@ -1,7 +1,9 @@
+import pandas as pd
 import pytest
 
 from src.biota_models.vegetation.model.veg_constants import (
     VegetationConstants,
+    _read_veg_constants_json,
     default_veg_constants_json,
 )
 from src.core.common.base_constants import BaseConstants
@@ -39,3 +41,37 @@ class TestVegetationConstants:
         # Validate the final expectations.
         assert test_values_dict is not None
         assert len(test_values_dict.items()) > 2
+
+    def test_set_constants_from_default_json_reads_file_once(self):
+        first_constants = VegetationConstants(species="Spartina")
+        second_constants = VegetationConstants(species="Spartina")
+
+        assert first_constants.maxGrowth_H == second_constants.maxGrowth_H
+        # the values are copied, the constants do not share the same lists.
+        assert first_constants.maxGrowth_H is not second_constants.maxGrowth_H
+        assert _read_veg_constants_json.cache_info().hits > 0
+
+    @pytest.mark.parametrize(
+        "begin_date, expected",
+        [
+            pytest.param("2022-03-20", False, id="Before colonization"),
+            pytest.param("2022-03-25", True, id="Overlapping its start"),
+            pytest.param("2022-05-25", True, id="Overlapping its end"),
+            pytest.param("2022-06-01", False, id="After colonization"),
+        ],
+    )
+    def test_in_colonization_period(self, begin_date: str, expected: bool):
+        # Spartina colonizes from the 1st of April to the 31st of May.
+        test_veg_constants = VegetationConstants(species="Spartina")
+        period = pd.date_range(begin_date, periods=10)
+
+        in_period = test_veg_constants.in_colonization_period(
+            period[0], period[-1] + pd.Timedelta(days=1), period
+        )
+
+        assert in_period == expected
+
+    def test_get_date_in_year(self):
+        date_in_year = VegetationConstants.get_date_in_year("2000-04-01", 2022)
+        assert date_in_year == pd.Timestamp(2022, 4, 1)
+        assert VegetationConstants.get_date_in_year("2000-04-01", 2022) is date_in_year
@@ -1,8 +1,11 @@
 from datetime import datetime
+from pathlib import Path
 from test.utils import TestUtils
 
 import numpy as np
+from netCDF4 import Dataset
 
+from src.biota_models.vegetation.model.veg_model import Vegetation
 from src.biota_models.vegetation.output.veg_output_model import (
     VegetationHisOutput,
     VegetationMapOutput,
@@ -38,6 +41,19 @@ class TestCoralMapOutput:
         assert test_map_output.first_year == 2021
         assert test_map_output.space == len(xy_array)
 
+    def test_initialize_chunks_fractions_over_ages(self, tmp_path: Path):
+        xy_array = np.zeros((100, 2))
+        test_map_output = VegetationMapOutput(
+            output_dir=tmp_path, xy_coordinates=xy_array, first_year=2021
+        )
+        test_map_output.initialize(Vegetation(species="Spartina"))
+        with Dataset(test_map_output.output_filepath) as nc_data:
+            for fraction in ("veg_frac_j", "veg_frac_m"):
+                n_space, n_age, n_time = nc_data[fraction].chunking()
+                assert (n_space, n_time) == (100, 1)
+                # each chunk (of doubles) has at least 64 KB.
+                assert n_space * n_age * 8 >= 64 * 1024
+
 
 class TestVegetationHisOutput:
     def test_init_mapoutput(self):
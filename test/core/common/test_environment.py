@@ -1,3 +1,4 @@
+import os
 from datetime import datetime
 from pathlib import Path
 from test.utils import TestUtils
@@ -75,6 +76,195 @@ class TestEnvironment:
         return_value = Environment.validate_dataframe_or_path(test_file)
         assert isinstance(return_value, pd.DataFrame)
 
+    @pytest.mark.parametrize(
+        "file_content",
+        [
+            pytest.param("date\tlight\n2000-01-01\t\n", id="Missing value"),
+            pytest.param("date\tlight\n\t42.0\n", id="Missing date"),
+        ],
+    )
+    def test_validate_dataframe_or_path_with_nans_raises(
+        self, tmp_path: Path, file_content: str
+    ):
+        test_file = tmp_path / "TS_PAR.txt"
+        test_file.write_text(file_content)
+        with pytest.raises(ValueError) as e_err:
+            Environment.validate_dataframe_or_path(test_file)
+        assert str(e_err.value) == f"NaNs detected in time series {test_file}"
+
+    def test_validate_dataframe_or_path_from_file_has_date_index(self):
+        test_file = self.get_test_input_data() / "TS_PAR.txt"
+        return_value = Environment.validate_dataframe_or_path(test_file)
+        assert isinstance(return_value.index, pd.DatetimeIndex)
+        assert return_value.index.name == "date"
+
+    @pytest.mark.parametrize("input_key, input_file", env_params_cases())
+    def test_cache_as_parquet_can_be_read_back(
+        self, tmp_path: Path, input_key: str, input_file: Path
+    ):
+        pytest.importorskip("pyarrow")
+        test_env = Environment(**{input_key: input_file})
+        parquet_files = test_env.cache_as_parquet(tmp_path)
+        assert list(parquet_files.keys()) == [input_key]
+
+        cached_env = Environment(**{input_key: parquet_files[input_key]})
+        assert getattr(cached_env, input_key).equals(getattr(test_env, input_key))
+
+    def test_validate_dataframe_or_path_rereads_modified_file(self, tmp_path: Path):
+        test_file = tmp_path / "TS_PAR.txt"
+        test_file.write_text("date\tlight\n2000-01-01\t4.2\n")
+        first_value = Environment.validate_dataframe_or_path(test_file)
+        # the returned time-series is a copy of the memoized one.
+        first_value["light"] = 0.0
+        assert Environment.validate_dataframe_or_path(test_file)["light"][0] == 4.2
+
+        test_file.write_text("date\tlight\n2000-01-01\t2.4\n")
+        modified_ns = test_file.stat().st_mtime_ns + 1
+        os.utime(test_file, ns=(modified_ns, modified_ns))
+        assert Environment.validate_dataframe_or_path(test_file)["light"][0] == 2.4
+
+    def test_from_validated_keeps_values(self):
+        input_file = self.get_test_input_data() / "TS_PAR.txt"
+        test_env = Environment(light=input_file)
+        validated_env = Environment.from_validated(light=test_env.light)
+        assert validated_env.light is test_env.light
+        assert validated_env.temperature is None
+        assert validated_env.get_dates().equals(Environment().get_dates())
+
+    def test_load_chunked_as_single_read(self):
+        input_dir = self.get_test_input_data()
+        test_env = Environment(
+            light=input_dir / "TS_PAR.txt", temperature=input_dir / "TS_SST.txt"
+        )
+        chunked_env = Environment.load_chunked(
+            chunksize=1000,
+            light=input_dir / "TS_PAR.txt",
+            temperature=(input_dir / "TS_SST.txt").as_posix(),
+        )
+        assert chunked_env.light.equals(test_env.light)
+        assert chunked_env.temperature.equals(test_env.temperature)
+        assert chunked_env.dates.equals(test_env.dates)
+
+    def test_from_files_as_validated(self):
+        input_dir = self.get_test_input_data()
+        input_values = dict(
+            light=input_dir / "TS_PAR.txt",
+            temperature=(input_dir / "TS_SST.txt").as_posix(),
+            storm_category=input_dir / "TS_stormcat.txt",
+        )
+        test_env = Environment(**input_values)
+        files_env = Environment.from_files(**input_values)
+        assert files_env.light.equals(test_env.light)
+        assert files_env.temperature.equals(test_env.temperature)
+        assert files_env.storm_category.equals(test_env.storm_category)
+        assert files_env.dates.equals(test_env.dates)
+
+    def test_from_files_not_existing_file_raises(self, tmp_path: Path):
+        test_file = tmp_path / "TS_PAR.txt"
+        with pytest.raises(FileNotFoundError):
+            Environment.from_files(light=test_file)
+
+    @pytest.mark.parametrize(
+        "file_content, validate_method",
+        [
+            pytest.param(
+                "date\tlight\n2000-01-02\t4.2\n2000-01-01\t2.4\n",
+                Environment.validate_dataframe_or_path,
+                id="Unsorted dates",
+            ),
+            pytest.param(
+                "date\tlight\n2000-01-01\t4.2\n2000-01-01\t2.4\n",
+                Environment.validate_dataframe_or_path,
+                id="Repeated dates",
+            ),
+            pytest.param(
+                "year\tstormcat\n2000\t0\n2000\t1\n",
+                Environment.validate_storm_category,
+                id="Repeated years",
+            ),
+        ],
+    )
+    def test_validate_not_increasing_dates_raises(
+        self, file_content: str, validate_method: Callable, tmp_path: Path
+    ):
+        test_file = tmp_path / "time_series.txt"
+        test_file.write_text(file_content)
+        with pytest.raises(ValueError) as e_info:
+            validate_method(test_file)
+        assert str(e_info.value) == (
+            f"Dates not strictly increasing in time series {test_file}"
+        )
+
+    def test_load_chunked_with_nans_raises(self, tmp_path: Path):
+        test_file = tmp_path / "TS_PAR.txt"
+        test_file.write_text("date\tlight\n2000-01-01\t4.2\n2000-01-02\t\n")
+        with pytest.raises(ValueError) as e_info:
+            Environment.load_chunked(chunksize=1, light=test_file)
+        assert str(e_info.value) == f"NaNs detected in time series {test_file}"
+
+    @pytest.mark.parametrize(
+        "read_values, validate_method, expected_error",
+        [
+            pytest.param(
+                pd.DataFrame(
+                    {"date": ["2000-01-01", "2000-01-02"], "light": [4.2, np.nan]}
+                ),
+                Environment.validate_dataframe_or_path,
+                "NaNs detected in time series",
+                id="NaNs",
+            ),
+            pytest.param(
+                pd.DataFrame({"light": [4.2, 2.4]}),
+                Environment.validate_dataframe_or_path,
+                "No date index or column in time series",
+                id="No dates",
+            ),
+            pytest.param(
+                pd.DataFrame(
+                    {"light": [4.2, 2.4]},
+                    index=pd.DatetimeIndex(["2000-01-02", "2000-01-01"], name="date"),
+                ),
+                Environment.validate_dataframe_or_path,
+                "Dates not strictly increasing in time series",
+                id="Unsorted dates",
+            ),
+            pytest.param(
+                pd.DataFrame({"year": [2000, 2000], "stormcat": [0, 1]}),
+                Environment.validate_storm_category,
+                "Dates not strictly increasing in time series",
+                id="Repeated years",
+            ),
+        ],
+    )
+    def test_validate_parquet_file_raises(
+        self,
+        read_values: pd.DataFrame,
+        validate_method: Callable,
+        expected_error: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        test_file = tmp_path / "time_series.parquet"
+        test_file.touch()
+        monkeypatch.setattr(pd, "read_parquet", lambda _: read_values.copy())
+        with pytest.raises(ValueError) as e_info:
+            validate_method(test_file)
+        assert str(e_info.value) == f"{expected_error} {test_file}"
+
+    def test_validate_parquet_file_with_date_column(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        test_file = tmp_path / "TS_PAR.parquet"
+        test_file.touch()
+        read_values = pd.DataFrame(
+            {"date": ["2000-01-01", "2000-01-02"], "light": [4.2, 2.4]}
+        )
+        monkeypatch.setattr(pd, "read_parquet", lambda _: read_values)
+        test_value = Environment.validate_dataframe_or_path(test_file)
+        assert isinstance(test_value.index, pd.DatetimeIndex)
+        assert test_value.index.name == "date"
+        assert test_value["light"].tolist() == [4.2, 2.4]
+
     def test_validate_dataframe_or_path_from_dataframe(self):
         test_value = pd.DataFrame(np.array([[42, 24], [24, 42]]), columns=["a", "b"])
         test_env = Environment.validate_storm_category(test_value)
@@ -160,3 +350,73 @@ class TestEnvironment:
         assert isinstance(test_env.temp_celsius, pd.DataFrame)
         assert isinstance(test_env.temp_kelvin, pd.DataFrame)
         assert isinstance(test_env.temp_mmm, pd.DataFrame)
+
+    def test_set_parameter_values_lac_sets_light_attenuation(self):
+        test_env = Environment()
+        test_env.set_parameter_values("LAC", 0.1)
+        assert (test_env.light_attenuation["light_attenuation"] == 0.1).all()
+
+    def test_set_parameter_values_unknown_parameter_raises(self):
+        with pytest.raises(ValueError) as e_info:
+            Environment().set_parameter_values("wind", 4.2)
+        assert str(e_info.value) == (
+            "Entered parameter (wind) not included. See documentation."
+        )
+
+    def test_set_parameter_values_copies_given_values(self):
+        test_env = Environment()
+        test_env.set_dates("2000, 01, 01", "2000, 01, 03")
+        values = np.array([1.0, 2.0, 3.0])
+        test_env.set_parameter_values("light", values)
+        values[0] = 4.2
+        assert test_env.light["light"].tolist() == [1.0, 2.0, 3.0]
+
+    def test_set_parameter_values_with_pre_date_shares_dates(self):
+        test_env = Environment()
+        test_env.set_dates("2000, 01, 01", "2000, 12, 31")
+        test_env.set_parameter_values("light", 4.2, pre_date=1)
+        test_env.set_parameter_values("aragonite", 2.4, pre_date=1)
+        assert test_env.light.index[0] == pd.Timestamp(1999, 1, 1)
+        assert test_env.light.index[-1] == pd.Timestamp(2000, 12, 31)
+        assert len(test_env.light) == 365 + 366
+        assert test_env.aragonite.index.equals(test_env.light.index)
+        # the cached dates are shared, renaming one index leaves the other.
+        test_env.light.index.name = "light_date"
+        assert test_env.aragonite.index.name != "light_date"
+
+    @pytest.mark.parametrize(
+        "as_frame",
+        [pytest.param(True, id="DataFrame"), pytest.param(False, id="Series")],
+    )
+    def test_set_parameter_values_aligns_dated_values(self, as_frame: bool):
+        test_env = Environment()
+        test_env.set_dates("2000, 01, 01", "2000, 01, 05")
+        dated_values = pd.Series(
+            [2.0, 1.0], index=pd.to_datetime(["2000-01-03", "1999-12-31"])
+        )
+        if as_frame:
+            dated_values = dated_values.to_frame("light")
+        test_env.set_parameter_values("light", dated_values)
+        assert test_env.light["light"].tolist() == [1.0, 1.0, 2.0, 2.0, 2.0]
+
+    def test_set_parameter_values_dated_values_after_dates_raises(self):
+        test_env = Environment()
+        test_env.set_dates("2000, 01, 01", "2000, 01, 05")
+        dated_values = pd.Series([2.0], index=pd.to_datetime(["2000-01-03"]))
+        with pytest.raises(ValueError):
+            test_env.set_parameter_values("light", dated_values)
+
+    def test_set_parameter_values_storm_per_year(self):
+        test_env = Environment()
+        test_env.set_dates("2000, 12, 30", "2002, 01, 02")
+        test_env.set_parameter_values("storm", [0, 1, 2])
+        assert test_env.storm_category.index.tolist() == [2000, 2001, 2002]
+        assert test_env.storm_category[0].tolist() == [0, 1, 2]
+        assert test_env.storm_category[0].dtype == np.int8
+
+    def test_validate_storm_category_as_int8(self):
+        input_file = self.get_test_input_data() / "TS_stormcat2.txt"
+        test_value = Environment.validate_storm_category(input_file)
+        assert test_value["stormcat"].dtype == np.int8
+        # the wave conditions are not categories, they keep their values.
+        assert test_value["Hs"].dtype == np.float64
@@ -1,9 +1,10 @@
 from typing import Any, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 import pytest
 
-from src.core.common.space_time import DataReshape, SpaceTime
+from src.core.common.space_time import DataReshape, SpaceTime, time_series_year
 
 
 class TestSpaceTime:
@@ -200,3 +201,22 @@ class TestDataReshape:
         result = reshape.matrix2array(var, dimension, conversion)
         for i, val in enumerate(expected_result):
             assert result[i] == val
+
+
+class TestTimeSeriesYear:
+    @pytest.mark.parametrize(
+        "sort_index",
+        [pytest.param(True, id="Sorted"), pytest.param(False, id="Unsorted")],
+    )
+    def test_time_series_year(self, sort_index: bool):
+        dates = pd.date_range("1999-12-30", "2001-01-02")
+        time_series = pd.DataFrame({"value": np.arange(len(dates))}, index=dates)
+        if not sort_index:
+            time_series = time_series.iloc[::-1]
+        expected = time_series[time_series.index.year == 2000]["value"].to_numpy()
+
+        result = time_series_year(time_series, 2000)
+
+        assert len(result) == 366
+        assert np.array_equal(result, expected)
+        assert len(time_series_year(time_series, 1900)) == 0
@@ -53,3 +53,13 @@ class TestHydrodynamicsFactory:
 
         # 3. Verify final expectation
         assert str(e_info.value) == expected_mssg
+
+    def test_get_hydrodynamic_model_type_is_looked_up_once(self):
+        HydrodynamicsFactory.get_hydrodynamic_model_type("Transect")
+        hits = HydrodynamicsFactory.get_hydrodynamic_model_type.cache_info().hits
+
+        mapped_type = HydrodynamicsFactory.get_hydrodynamic_model_type("Transect")
+
+        assert mapped_type == Transect
+        cache_info = HydrodynamicsFactory.get_hydrodynamic_model_type.cache_info()
+        assert cache_info.hits == hits + 1
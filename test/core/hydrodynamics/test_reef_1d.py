@@ -91,6 +91,14 @@ class TestReef1D:
         test_ref1d.bath = np.array([1])
         assert test_ref1d.wave_number[0] == pytest.approx(4.02686311)
 
+    def test_wave_number_dry_cell(self):
+        test_ref1d = Reef1D()
+        test_ref1d.Tp = 1
+        test_ref1d.bath = np.array([1, 0])
+        wave_number = test_ref1d.wave_number
+        assert wave_number[0] == pytest.approx(4.02686311)
+        assert wave_number[1] == 0
+
     def test_wave_frequency(self):
         test_ref1d = Reef1D()
         test_ref1d.Tp = 1
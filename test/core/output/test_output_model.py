@@ -1,5 +1,10 @@
+from pathlib import Path
 from test.utils import TestUtils
 
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
 from src.core.output.base_output_model import BaseOutput, BaseOutputParameters
 from src.core.output.output_protocol import OutputProtocol
 
@@ -14,3 +19,98 @@ class TestBaseOutput:
         assert test_baseoutput.output_filepath == test_dir / file_name
         # This should be false as long as BaseOutputParameters remains 'without parameters'.
         assert not test_baseoutput.valid_output()
+
+    def test_append_dataset_kept_open_until_closed(self, tmp_path: Path):
+        test_baseoutput = BaseOutput(output_dir=tmp_path, output_filename="test.nc")
+        with Dataset(test_baseoutput.output_filepath, "w") as nc_data:
+            nc_data.createDimension("time", None)
+            nc_data.createVariable("time", int, ("time",))
+
+        for i in range(2):
+            with test_baseoutput.append_dataset() as nc_data:
+                nc_data["time"][i] = 2000 + i
+            if i == 0:
+                first_dataset = nc_data
+            assert nc_data is first_dataset
+            assert nc_data.isopen()
+
+        test_baseoutput.close()
+        assert not first_dataset.isopen()
+        with Dataset(test_baseoutput.output_filepath) as nc_data:
+            assert nc_data["time"][:].tolist() == [2000, 2001]
+
+    def test_context_manager_closes_dataset_on_error(self, tmp_path: Path):
+        test_baseoutput = BaseOutput(output_dir=tmp_path, output_filename="test.nc")
+        with Dataset(test_baseoutput.output_filepath, "w") as nc_data:
+            nc_data.createDimension("time", None)
+            nc_data.createVariable("time", int, ("time",))
+
+        with pytest.raises(RuntimeError):
+            with test_baseoutput:
+                with test_baseoutput.append_dataset() as nc_data:
+                    nc_data["time"][0] = 2000
+                raise RuntimeError("Failing update")
+
+        assert not nc_data.isopen()
+        with Dataset(test_baseoutput.output_filepath) as nc_data:
+            assert nc_data["time"][:].tolist() == [2000]
+
+    def test_sync_flushes_dataset_kept_open(self, tmp_path: Path):
+        test_baseoutput = BaseOutput(output_dir=tmp_path, output_filename="test.nc")
+        # nothing to flush yet.
+        test_baseoutput.sync()
+        with Dataset(test_baseoutput.output_filepath, "w") as nc_data:
+            nc_data.createDimension("time", None)
+            nc_data.createVariable("time", int, ("time",))
+
+        with test_baseoutput.append_dataset() as nc_data:
+            nc_data["time"][0] = 2000
+        test_baseoutput.sync()
+        assert nc_data.isopen()
+        test_baseoutput.close()
+        with Dataset(test_baseoutput.output_filepath) as nc_data:
+            assert nc_data["time"][:].tolist() == [2000]
+
+    @pytest.mark.parametrize(
+        "n_space, n_time, expected",
+        [
+            pytest.param(8192, 1, (1, 8192), id="Map, one chunk per write"),
+            pytest.param(100, 1, (82, 100), id="Map, several writes per chunk"),
+            pytest.param(7, 365, (1460, 7), id="His, whole years per chunk"),
+            pytest.param(0, 365, (8395, 1), id="No stations"),
+        ],
+    )
+    def test_get_chunksizes(self, n_space: int, n_time: int, expected: tuple):
+        chunksizes = BaseOutput.get_chunksizes(n_space, n_time)
+        assert chunksizes == expected
+        assert chunksizes[0] % n_time == 0
+        assert chunksizes[0] * chunksizes[1] * 8 >= 64 * 1024
+
+    def test_get_variable_settings_compressed_and_chunked(self):
+        settings = BaseOutput.get_variable_settings(7, 365)
+        assert settings["chunksizes"] == BaseOutput.get_chunksizes(7, 365)
+        assert settings["zlib"] and settings["shuffle"]
+        # the compression is lossless, values are not truncated.
+        assert "least_significant_digit" not in settings
+
+    @pytest.mark.parametrize(
+        "time_indices, expected",
+        [
+            pytest.param(np.array([3, 4, 5]), slice(3, 6), id="Consecutive"),
+            pytest.param(np.array([3]), slice(3, 4), id="Single"),
+        ],
+    )
+    def test_get_time_index_consecutive_as_slice(
+        self, time_indices: np.ndarray, expected: slice
+    ):
+        assert BaseOutput.get_time_index(time_indices) == expected
+
+    @pytest.mark.parametrize(
+        "time_indices",
+        [
+            pytest.param(np.array([3, 5, 6]), id="Gap"),
+            pytest.param(np.array([], dtype=int), id="Empty"),
+        ],
+    )
+    def test_get_time_index_not_consecutive_as_given(self, time_indices: np.ndarray):
+        assert BaseOutput.get_time_index(time_indices) is time_indices
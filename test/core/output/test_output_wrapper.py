@@ -42,3 +42,22 @@ class TestBaseOutputWrapper:
             repr(test_output)
             == f"Output(xy_coordinates=[[0. 1.]\n [1. 0.]], first_date={now_time})"
         )
+
+    def test_get_xy_stations_nearest_first_point(self):
+        # the second and last points coincide, the first of them is the nearest.
+        xy_array = np.array([[0, 0], [1, 1], [2, 2], [1, 1]], np.float64)
+        outpoint_array = np.array([False, True, False, True])
+        xy_stations, idx_stations = BaseOutputWrapper.get_xy_stations(
+            xy_array, outpoint_array
+        )
+        assert idx_stations.tolist() == [1, 1]
+        assert (xy_stations == np.array([[1, 1], [1, 1]])).all()
+
+    def test_get_xy_stations_without_stations(self):
+        xy_array = np.array([[0, 1], [1, 0]], np.float64)
+        outpoint_array = np.array([False, False])
+        xy_stations, idx_stations = BaseOutputWrapper.get_xy_stations(
+            xy_array, outpoint_array
+        )
+        assert len(idx_stations) == 0
+        assert xy_stations.shape == (0, 2)
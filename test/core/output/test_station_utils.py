@@ -0,0 +1,52 @@
+import numpy as np
+
+from src.core.output import station_utils
+from src.core.output.base_output_wrapper import BaseOutputWrapper
+from src.core.output.station_utils import get_xy_stations
+
+
+class TestStationUtils:
+    def test_get_xy_stations_matches_output_wrapper(self):
+        xy_array = np.array([[0, 1], [1, 0], [2, 2]], np.float64)
+        outpoint_array = np.array([False, True, True])
+        xy_stations, idx_stations = get_xy_stations(xy_array, outpoint_array)
+        (
+            expected_xy_stations,
+            expected_idx_stations,
+        ) = BaseOutputWrapper.get_xy_stations(xy_array, outpoint_array)
+        assert (xy_stations == expected_xy_stations).all()
+        assert (idx_stations == expected_idx_stations).all()
+
+    def test_get_xy_stations_returns_independent_arrays(self):
+        xy_array = np.array([[0, 1], [1, 0]], np.float64)
+        outpoint_array = np.array([True, True])
+        _, idx_stations = get_xy_stations(xy_array, outpoint_array)
+        idx_stations[:] = -1
+        _, idx_stations = get_xy_stations(xy_array, outpoint_array)
+        assert idx_stations.tolist() == [0, 1]
+
+    def test_get_xy_stations_keeps_no_grid_copies(self):
+        xy_array = np.random.default_rng(0).random((10000, 2))
+        outpoint_array = np.zeros(10000, dtype=bool)
+        outpoint_array[:3] = True
+        get_xy_stations(xy_array, outpoint_array)
+
+        # only digests of the grid and output points are stored as key.
+        key_bytes = [
+            len(key_item)
+            for key in station_utils._xy_stations_cache
+            for key_item in key
+            if isinstance(key_item, bytes)
+        ]
+        assert max(key_bytes) < xy_array.nbytes / 100
+
+    def test_get_xy_stations_cache_is_bounded(self):
+        outpoint_array = np.array([True, False])
+        for i in range(station_utils._xy_stations_cache_size + 5):
+            xy_array = np.array([[i, 0], [0, i]], np.float64)
+            _, idx_stations = get_xy_stations(xy_array, outpoint_array)
+            assert idx_stations.tolist() == [0]
+        assert (
+            len(station_utils._xy_stations_cache)
+            == station_utils._xy_stations_cache_size
+        )
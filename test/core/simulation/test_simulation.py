@@ -3,8 +3,12 @@ from test.utils import TestUtils
 from typing import Any, Callable, Optional, Union
 
 import pytest
+from netCDF4 import Dataset
 
 from src.biota_models.coral.model.coral_model import Coral
+from src.biota_models.coral.simulation.coral_transect_simulation import (
+    CoralTransectSimulation,
+)
 from src.core.common.base_constants import BaseConstants
 from src.core.common.environment import Environment
 from src.core.hydrodynamics.delft3d import DimrModel, FlowFmModel
@@ -45,3 +49,76 @@ class TestVanillaSimulation:
         # Verify abstract methods raise nothing.
         test_sim.configure_hydrodynamics()
         test_sim.configure_output()
+
+    def test_run_sweep_runs_each_simulation(self, tmp_path: Path):
+        overrides = [
+            dict(working_dir=tmp_path / "first"),
+            dict(working_dir=tmp_path / "second"),
+        ]
+
+        output_dirs = Simulation.run_sweep(
+            dict(mode="Transect"), overrides, max_workers=2
+        )
+
+        # the vanilla simulation has no output.
+        assert output_dirs == [None, None]
+
+    def test_run_sweep_without_own_working_dirs_raises_valueerror(self):
+        with pytest.raises(ValueError) as e_info:
+            Simulation.run_sweep(dict(mode="Transect"), [dict(), dict()])
+        assert (
+            str(e_info.value)
+            == "Each simulation of the sweep needs its own working_dir."
+        )
+
+
+class TestSimulationSweep:
+    @staticmethod
+    def get_transect_config() -> dict:
+        input_dir = TestUtils.get_local_test_data_dir("transect_case") / "input"
+        return dict(
+            constants=input_dir / "coral_input.txt",
+            environment=dict(
+                light=input_dir / "TS_PAR.txt",
+                temperature=input_dir / "TS_SST.txt",
+                storm=input_dir / "TS_stormcat2.txt",
+                dates=("2000-01-01", "2100-01-01"),
+            ),
+            hydrodynamics=dict(
+                definition_file=input_dir / "TS_waves.txt",
+                config_file=input_dir / "config.csv",
+            ),
+            biota=dict(dc=0.125, hc=0.125, bc=0.1, tc=0.1, ac=0.2, Csp=0.6),
+        )
+
+    def test_run_sweep_writes_output_per_working_dir(self, tmp_path: Path):
+        overrides = [
+            dict(working_dir=tmp_path / "first"),
+            dict(working_dir=tmp_path / "second"),
+        ]
+
+        output_dirs = CoralTransectSimulation.run_sweep(
+            self.get_transect_config(), overrides, duration=1, max_workers=2
+        )
+
+        assert output_dirs == [
+            tmp_path / "first" / "output",
+            tmp_path / "second" / "output",
+        ]
+        for output_dir in output_dirs:
+            for output_file in ("CoralModel_map.nc", "CoralModel_his.nc"):
+                with Dataset(output_dir / output_file) as nc_data:
+                    assert nc_data["time"].size > 0
+
+    def test_run_sweep_sharing_working_dir_raises_valueerror(self, tmp_path: Path):
+        overrides = [
+            dict(working_dir=tmp_path, output_dir=tmp_path / "first"),
+            dict(working_dir=tmp_path / ".", output_dir=tmp_path / "second"),
+        ]
+        with pytest.raises(ValueError) as e_info:
+            CoralTransectSimulation.run_sweep(self.get_transect_config(), overrides)
+        assert (
+            str(e_info.value)
+            == "Each simulation of the sweep needs its own working_dir."
+        )
+        assert not (tmp_path / "output").exists()
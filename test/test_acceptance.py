@@ -5,7 +5,6 @@ from typing import Callable
 import numpy as np
 import pytest
 from netCDF4 import Dataset
-from numpy import loadtxt, savetxt
 
 from src.biota_models.coral.simulation.coral_delft3d_simulation import (
     CoralDimrSimulation,
@@ -210,24 +209,28 @@ class TestAcceptance:
         )
 
         def compare_files(created_file: Path):
-            def normalize_name_with_capitals(name: str) -> str:
-                if any(x.isupper() for x in name):
-                    return name + name
-                return name
-
-            ref_dir = expected_dir / created_file.stem.split("_")[-1]
-            with Dataset(created_file, "r", format="NETCDF4") as out_netcdf:
-                for variable in out_netcdf.variables:
-                    variable_filename = normalize_name_with_capitals(variable)
-                    expected_file = (
-                        ref_dir / f"ref_{variable_filename}_{created_file.stem}.txt"
-                    )
+            expected_file = expected_dir / f"ref_{created_file.stem}.npz"
+            assert (
+                expected_file.is_file()
+            ), f"Expected file not found at {expected_file}"
+            # read the whole file into memory at once (diskless) and all its output
+            # in one pass, then compare once the file is closed.
+            with Dataset(
+                created_file, "r", format="NETCDF4", diskless=True
+            ) as out_netcdf:
+                # plain arrays, the output is not expected to have missing values.
+                out_netcdf.set_auto_mask(False)
+                out_variables = {
+                    variable: out_netcdf[variable][:]
+                    for variable in out_netcdf.variables
+                }
+            with np.load(expected_file) as ref_netcdf:
+                for variable, out_variable in out_variables.items():
                     assert (
-                        expected_file.is_file()
-                    ), f"Expected file for variable {variable} not found at {expected_file}"
-                    ref_variable = loadtxt(expected_file)
+                        variable in ref_netcdf
+                    ), f"Expected data for variable {variable} not found in {expected_file}"
                     assert np.allclose(
-                        ref_variable, out_netcdf[variable]
+                        ref_netcdf[variable], out_variable
                     ), f"{variable} not close to reference data."
 
         compare_files(run_trans.output.his_output.output_filepath)
@@ -345,25 +348,23 @@ class TestAcceptance:
     )
     def test_util_output_variables_netcdf(self, nc_filename: str):
         """
-        This test is only meant to be run locally, it helps generating the expected data as .txt files.
+        This test is only meant to be run locally, it helps generating the expected data as a .npz file
+        (one array per variable).
         """
         expected_dir = (
             TestUtils.get_local_test_data_dir("transect_case") / "expected_output"
         )
 
-        def normalize_name_with_capitals(name: str) -> str:
-            if any(x.isupper() for x in name):
-                return name + name
-            return name
-
         def output_file(netcdf_file: Path):
-            out_dir = netcdf_file.parent / netcdf_file.stem.split("_")[-1]
-            out_dir.mkdir(parents=True, exist_ok=True)
+            ref_file = netcdf_file.parent / f"ref_{netcdf_file.stem}.npz"
             with Dataset(netcdf_file, "r", format="NETCDF4") as ref_netcdf:
-                for variable in ref_netcdf.variables:
-                    variable_name = normalize_name_with_capitals(variable)
-                    ref_file = out_dir / f"ref_{variable_name}_{netcdf_file.stem}.txt"
-                    savetxt(ref_file, ref_netcdf[variable])
+                np.savez_compressed(
+                    ref_file,
+                    **{
+                        variable: np.ma.getdata(ref_netcdf[variable][:])
+                        for variable in ref_netcdf.variables
+                    },
+                )
 
         output_file(expected_dir / nc_filename)
 